@@ -5,7 +5,7 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from ..utils.logger import get_logger
 
 logger = get_logger("i18n.translator")
@@ -19,6 +19,8 @@ class Translator:
         self.fallback_language = fallback_language
         self.translations: Dict[str, Dict] = {}
         self.languages_dir = Path(__file__).parent / 'languages'
+        # (language, key) -> raw text after fallback, None if missing everywhere
+        self._resolved: Dict[Tuple[str, str], Optional[str]] = {}
 
         # Load the current and fallback languages
         self._load_language(fallback_language)
@@ -32,6 +34,7 @@ class Translator:
             if lang_file.exists():
                 with open(lang_file, 'r', encoding='utf-8') as f:
                     self.translations[lang_code] = json.load(f)
+                self._resolved.clear()
                 logger.info(f"Loaded language: {lang_code}")
                 return True
             else:
@@ -52,14 +55,9 @@ class Translator:
         Returns:
             Translated and formatted string
         """
-        # Try current language first
-        text = self._get_from_dict(self.translations.get(self.current_language, {}), key)
+        text = self._resolve(key)
 
-        # Fall back to default language if not found
-        if text is None and self.current_language != self.fallback_language:
-            text = self._get_from_dict(self.translations.get(self.fallback_language, {}), key)
-
-        # If still not found, return the key itself
+        # If not found, return the key itself
         if text is None:
             logger.debug(f"Translation not found for key: {key}")
             return f"[{key}]"
@@ -80,6 +78,24 @@ class Translator:
 
         return text
 
+    def _resolve(self, key: str) -> Optional[str]:
+        """Look up the raw text for key in the current language, then the fallback (cached)"""
+        cache_key = (self.current_language, key)
+        try:
+            return self._resolved[cache_key]
+        except KeyError:
+            pass
+
+        # Try current language first
+        text = self._get_from_dict(self.translations.get(self.current_language, {}), key)
+
+        # Fall back to default language if not found
+        if text is None and self.current_language != self.fallback_language:
+            text = self._get_from_dict(self.translations.get(self.fallback_language, {}), key)
+
+        self._resolved[cache_key] = text
+        return text
+
     def _get_from_dict(self, data: Dict, key: str) -> Optional[str]:
         """Navigate nested dictionary using dot notation"""
         keys = key.split('.')
@@ -4,12 +4,20 @@ import asyncio
 import signal
 import sys
 from pathlib import Path
+from typing import Any, Coroutine
 
 from .storage.db import close_database, create_tables, init_database
 from .telnet_server import TelnetServer
 from .utils.config import load_config
 from .utils.logger import setup_logging
 
+try:
+    # Optional faster event loop (pip install perestroika-bbs[speed]);
+    # not available on Windows, where the stdlib loop is used
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = setup_logging()
 
 
@@ -77,9 +85,21 @@ async def main_async() -> None:
         await shutdown(server)
 
 
+def run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run the coroutine on uvloop when installed, else on the stdlib loop."""
+    if uvloop is None:
+        asyncio.run(coro)
+        return
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(coro)
+
+
 def main() -> None:
+    if uvloop is not None:
+        logger.info("Using uvloop event loop")
     try:
-        asyncio.run(main_async())
+        run(main_async())
     except KeyboardInterrupt:
         pass
     except Exception as e:
@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import secrets
 from typing import Optional
@@ -24,7 +25,8 @@ class AuthManager:
 
     async def hash_password(self, password: str) -> str:
         try:
-            return self.hasher.hash(password)
+            # Argon2 releases the GIL, so hashes run in parallel off the event loop
+            return await asyncio.to_thread(self.hasher.hash, password)
         except Exception as e:
             logger.error(f"Error hashing password: {e}")
             raise
@@ -43,7 +45,7 @@ class AuthManager:
             - needs_rehash: True if the hash should be updated with new parameters.
         """
         try:
-            self.hasher.verify(hash, password)
+            await asyncio.to_thread(self.hasher.verify, hash, password)
             needs_rehash = self.hasher.check_needs_rehash(hash)
             return True, needs_rehash
         except (VerifyMismatchError, VerificationError):
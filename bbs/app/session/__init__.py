@@ -12,7 +12,8 @@ The facade maintains full backward compatibility with the original Session API.
 import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from types import SimpleNamespace
+from typing import Any, Coroutine, Dict, Optional, Set
 
 from telnetlib3 import TelnetReader, TelnetWriter
 
@@ -44,6 +45,37 @@ __all__ = [
 
 logger = get_logger("session")
 
+# Parameterless strings used by LoginUI, resolved once per language.
+# Attribute names are the keys with dots replaced by underscores,
+# e.g. 'login.username_prompt' -> login_strings.login_username_prompt
+_LOGIN_KEYS = (
+    'login.title',
+    'login.your_choice',
+    'login.username_prompt',
+    'login.password_prompt',
+    'login.invalid_credentials',
+    'login.max_attempts',
+    'login.guest_login',
+    'register.title',
+    'register.username_prompt',
+    'register.username_short',
+    'register.username_long',
+    'register.username_taken',
+    'register.password_prompt',
+    'register.password_short',
+    'register.password_confirm',
+    'register.password_mismatch',
+    'register.email_prompt',
+    'register.realname_prompt',
+    'register.location_prompt',
+    'register.failed',
+    'common.invalid_choice',
+    'common.invalid_input',
+)
+
+# (language, seven_bit) -> resolved login strings, shared by all sessions
+_LOGIN_STRINGS_CACHE: Dict[tuple[str, bool], SimpleNamespace] = {}
+
 
 @dataclass
 class Session:
@@ -82,6 +114,17 @@ class Session:
     _io_component: Optional[SessionIO] = field(default=None, init=False, repr=False)
     _display_component: Optional[SessionDisplay] = field(default=None, init=False, repr=False)
 
+    # Per-language caches (reset in set_language)
+    _login_menu_cache: Optional[list[tuple[str, str]]] = field(default=None, init=False, repr=False)
+    # (key, language, seven_bit) -> final text of t() calls without kwargs
+    _t_cache: Dict[tuple, str] = field(default_factory=dict, init=False, repr=False)
+
+    # Set once disconnect() starts, so timed pauses can end early
+    disconnect_event: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+
+    # Fire-and-forget work started via spawn(), awaited on disconnect
+    _background_tasks: Set[asyncio.Task] = field(default_factory=set, init=False, repr=False)
+
     def __post_init__(self):
         """Initialize components and wire them together."""
         # Build state component kwargs - only include id if explicitly set
@@ -207,8 +250,31 @@ class Session:
         """Read password input without echo."""
         return await self._io_component.read_password(prompt, max_length)
 
+    def spawn(self, coro: Coroutine) -> asyncio.Task:
+        """Run a coroutine in the background; it is awaited when the session disconnects."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_task_done)
+        return task
+
+    def _background_task_done(self, task: asyncio.Task) -> None:
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Session {self.id}: background task failed: {task.exception()}")
+
+    async def pause_for(self, seconds: float) -> bool:
+        """Wait up to `seconds`, returning early (True) if the session disconnects."""
+        try:
+            await asyncio.wait_for(self.disconnect_event.wait(), seconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def disconnect(self) -> None:
         """Disconnect the session."""
+        self.disconnect_event.set()
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
         await self._io_component.disconnect()
         self._sync_from_components()
         self.reader = None
@@ -277,6 +343,16 @@ class Session:
 
     def t(self, key: str, **kwargs) -> str:
         """Translate a string using the session's current language."""
+        if not kwargs:
+            cache_key = (key, self.language, self.capabilities.seven_bit)
+            text = self._t_cache.get(cache_key)
+            if text is None:
+                text = self._translate(key)
+                self._t_cache[cache_key] = text
+            return text
+        return self._translate(key, **kwargs)
+
+    def _translate(self, key: str, **kwargs) -> str:
         text = self.translator.get(key, **kwargs)
 
         # Apply transliteration for 7-bit ASCII mode with Russian
@@ -286,10 +362,35 @@ class Session:
 
         return text
 
+    def translated_login_menu(self) -> list[tuple[str, str]]:
+        """Get the login menu options translated for the current language (cached)."""
+        if self._login_menu_cache is None:
+            self._login_menu_cache = [
+                ("L", self.t('login.login_option')),
+                ("N", self.t('login.register_option')),
+                ("G", self.t('login.guest_option')),
+                ("Q", self.t('login.quit_option')),
+            ]
+        return self._login_menu_cache
+
+    @property
+    def login_strings(self) -> SimpleNamespace:
+        """Get the LoginUI strings for the current language (built once per language)."""
+        cache_key = (self.language, self.capabilities.seven_bit)
+        strings = _LOGIN_STRINGS_CACHE.get(cache_key)
+        if strings is None:
+            strings = SimpleNamespace(**{
+                key.replace('.', '_'): self.t(key) for key in _LOGIN_KEYS
+            })
+            _LOGIN_STRINGS_CACHE[cache_key] = strings
+        return strings
+
     def set_language(self, lang_code: str) -> bool:
         """Change the session's language."""
         if self.translator.set_language(lang_code):
             self.language = lang_code
+            self._login_menu_cache = None
+            self._t_cache.clear()
             if self._state_component:
                 self._state_component.language = lang_code
             # Suggest appropriate encoding for Russian
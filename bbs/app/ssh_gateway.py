@@ -208,7 +208,7 @@ class BBSSSHSession(SSHServerSession):
 
             # Pre-authenticate with the SSH username
             user_repo = UserRepository()
-            user = await user_repo.get_by_username(self._username)
+            user = await user_repo.get_by_username(self._username, fresh=True)
             if user:
                 self._session.user_id = user.id
                 self._session.username = user.username
@@ -290,7 +290,7 @@ class BBSSSHServer(asyncssh.SSHServer):
         """Validate user credentials"""
         try:
             # Use the user repository to validate
-            user = await self.user_repo.get_by_username(username)
+            user = await self.user_repo.get_by_username(username, fresh=True)
             if user:
                 # Verify password using the same method as telnet login
                 from argon2 import PasswordHasher
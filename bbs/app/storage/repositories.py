@@ -1,5 +1,8 @@
+import asyncio
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +17,65 @@ from ..utils.logger import get_logger
 logger = get_logger("storage.repositories")
 
 
+class _UserCache:
+    """
+    Per-process LRU cache of user rows keyed by id and by username.
+
+    Misses are cached too (as None) with a shorter TTL, so repeated probes
+    for names that don't exist (registration, mail compose) stay off the
+    database while a user created by another process shows up quickly.
+    Entries are invalidated by UserRepository on every write, but writes
+    made by another process (or straight to the database) are only seen
+    once the entry expires, so authentication reads pass fresh=True.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 60.0, negative_ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[tuple, tuple[float, Optional[User]]]" = OrderedDict()
+
+    def get(self, key: tuple):
+        """Return the cached user, None for a cached miss, or _MISSING"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return self._MISSING
+        expires, user = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return self._MISSING
+        self._entries.move_to_end(key)
+        return user
+
+    def put(self, key: tuple, user: Optional[User]) -> None:
+        ttl = self.ttl if user is not None else self.negative_ttl
+        self._entries[key] = (time.monotonic() + ttl, user)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def put_user(self, user: User) -> None:
+        self.put(("id", user.id), user)
+        self.put(("name", user.username), user)
+
+    def invalidate_username(self, username: str) -> None:
+        self._entries.pop(("name", username), None)
+
+    def invalidate_user(self, user_id: int) -> None:
+        self._entries.pop(("id", user_id), None)
+        stale = [
+            key for key, (_, user) in self._entries.items()
+            if user is not None and user.id == user_id
+        ]
+        for key in stale:
+            del self._entries[key]
+
+
+_user_cache = _UserCache()
+
+
 class UserRepository:
     async def create(
         self,
@@ -22,6 +84,7 @@ class UserRepository:
         email: Optional[str] = None,
         real_name: Optional[str] = None,
         location: Optional[str] = None,
+        access_level: Optional[int] = None,
     ) -> Optional[User]:
         try:
             async with get_session() as session:
@@ -33,25 +96,61 @@ class UserRepository:
                     location=location,
                     created_at=datetime.utcnow(),
                 )
+                # Set in the same INSERT rather than a follow-up update; None keeps the column default
+                if access_level is not None:
+                    user.access_level = access_level
                 session.add(user)
                 await session.commit()
                 await session.refresh(user)
+                _user_cache.invalidate_username(username)
                 return user
         except Exception as e:
             logger.error(f"Failed to create user: {e}")
             return None
 
-    async def get_by_id(self, user_id: int) -> Optional[User]:
+    async def get_by_id(self, user_id: int, fresh: bool = False) -> Optional[User]:
+        if not fresh:
+            cached = _user_cache.get(("id", user_id))
+            if cached is not _UserCache._MISSING:
+                return cached
+
         async with get_session() as session:
             result = await session.execute(select(User).where(User.id == user_id))
-            return result.scalar_one_or_none()
+            user = result.scalar_one_or_none()
+
+        if user is not None:
+            _user_cache.put_user(user)
+        else:
+            _user_cache.put(("id", user_id), None)
+        return user
+
+    async def get_by_usernames(self, usernames: Iterable[str]) -> Dict[str, User]:
+        """Fetch several users in one query, keyed by username"""
+        names = set(usernames)
+        if not names:
+            return {}
+        async with get_session() as session:
+            result = await session.execute(select(User).where(User.username.in_(names)))
+            return {user.username: user for user in result.scalars().all()}
+
+    async def get_by_username(self, username: str, fresh: bool = False) -> Optional[User]:
+        """Look up a user; fresh=True skips the cache (password, ban and access checks)"""
+        if not fresh:
+            cached = _user_cache.get(("name", username))
+            if cached is not _UserCache._MISSING:
+                return cached
 
-    async def get_by_username(self, username: str) -> Optional[User]:
         async with get_session() as session:
             result = await session.execute(
                 select(User).where(User.username == username)
             )
-            return result.scalar_one_or_none()
+            user = result.scalar_one_or_none()
+
+        if user is not None:
+            _user_cache.put_user(user)
+        else:
+            _user_cache.put(("name", username), None)
+        return user
 
     async def update_last_login(self, user_id: int) -> None:
         async with get_session() as session:
@@ -64,6 +163,7 @@ class UserRepository:
                 )
             )
             await session.commit()
+            _user_cache.invalidate_user(user_id)
 
     async def get_active_users(self, limit: int = 50) -> List[User]:
         async with get_session() as session:
@@ -75,6 +175,19 @@ class UserRepository:
             )
             return result.scalars().all()
 
+    async def get_active_users_summary(
+        self, limit: int = 50
+    ) -> List[Tuple[str, Optional[datetime], Optional[str]]]:
+        """(username, last_login_at, location) of active users, most recent login first"""
+        async with get_session() as session:
+            result = await session.execute(
+                select(User.username, User.last_login_at, User.location)
+                .where(User.status == UserStatus.ACTIVE)
+                .order_by(User.last_login_at.desc())
+                .limit(limit)
+            )
+            return [tuple(row) for row in result.all()]
+
     async def search_users(self, query: str) -> List[User]:
         async with get_session() as session:
             result = await session.execute(
@@ -109,6 +222,7 @@ class UserRepository:
                 .values(access_level=access_level)
             )
             await session.commit()
+            _user_cache.invalidate_user(user_id)
 
     async def update_status(self, user_id: int, status: UserStatus) -> None:
         async with get_session() as session:
@@ -118,6 +232,7 @@ class UserRepository:
                 .values(status=status)
             )
             await session.commit()
+            _user_cache.invalidate_user(user_id)
 
     async def update_password(self, user_id: int, password_hash: str) -> None:
         async with get_session() as session:
@@ -127,6 +242,7 @@ class UserRepository:
                 .values(password_hash=password_hash)
             )
             await session.commit()
+            _user_cache.invalidate_user(user_id)
 
     async def delete_user(self, user_id: int) -> None:
         async with get_session() as session:
@@ -136,6 +252,7 @@ class UserRepository:
                 .values(status=UserStatus.DELETED)
             )
             await session.commit()
+            _user_cache.invalidate_user(user_id)
 
     async def update_terminal_settings(
         self,
@@ -161,6 +278,7 @@ class UserRepository:
                     .values(**values)
                 )
                 await session.commit()
+                _user_cache.invalidate_user(user_id)
 
 
 class BoardRepository:
@@ -207,6 +325,15 @@ class BoardRepository:
             )
             return result.scalar_one_or_none()
 
+    async def get_boards_by_names(self, names: Iterable[str]) -> Dict[str, Board]:
+        """Fetch several boards in one query, keyed by name"""
+        names = set(names)
+        if not names:
+            return {}
+        async with get_session() as session:
+            result = await session.execute(select(Board).where(Board.name.in_(names)))
+            return {board.name: board for board in result.scalars().all()}
+
     async def create_post(
         self,
         board_id: int,
@@ -243,7 +370,49 @@ class BoardRepository:
 
             await session.commit()
             await session.refresh(post)
-            return post
+
+        _user_cache.invalidate_user(author_id)
+        return post
+
+    async def create_posts_bulk(self, rows: Iterable[Tuple[int, int, str, str]]) -> int:
+        """
+        Insert top-level posts given as (board_id, author_id, subject, body)
+        in one transaction, bumping board and author counters once per id.
+        Returns the number of posts inserted.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        now = datetime.utcnow()
+        board_counts = Counter(board_id for board_id, _, _, _ in rows)
+        author_counts = Counter(author_id for _, author_id, _, _ in rows)
+
+        async with get_session() as session:
+            session.add_all([
+                Post(board_id=board_id, author_id=author_id, subject=subject, body=body, created_at=now)
+                for board_id, author_id, subject, body in rows
+            ])
+
+            for board_id, count in board_counts.items():
+                await session.execute(
+                    update(Board)
+                    .where(Board.id == board_id)
+                    .values(post_count=Board.post_count + count, last_post_at=now)
+                )
+
+            for author_id, count in author_counts.items():
+                await session.execute(
+                    update(User)
+                    .where(User.id == author_id)
+                    .values(total_posts=User.total_posts + count)
+                )
+
+            await session.commit()
+
+        for author_id in author_counts:
+            _user_cache.invalidate_user(author_id)
+        return len(rows)
 
     async def get_posts(
         self,
@@ -342,6 +511,15 @@ class ChatRepository:
             )
             return result.scalar_one_or_none()
 
+    async def get_rooms_by_names(self, names: Iterable[str]) -> Dict[str, ChatRoom]:
+        """Fetch several chat rooms in one query, keyed by name"""
+        names = set(names)
+        if not names:
+            return {}
+        async with get_session() as session:
+            result = await session.execute(select(ChatRoom).where(ChatRoom.name.in_(names)))
+            return {room.name: room for room in result.scalars().all()}
+
     async def save_message(
         self,
         room_id: int,
@@ -549,18 +727,44 @@ class FileRepository:
             return result.all()
 
 
+# Process-wide get_stats() cache: (computed_at, stats). The lock makes
+# concurrent misses share a single round of COUNT queries.
+_STATS_TTL = 5.0
+_stats_cache: Optional[tuple[float, dict]] = None
+_stats_lock = asyncio.Lock()
+
+
 class SystemRepository:
     async def get_stats(self) -> dict:
         """Get system statistics.
 
-        NOTE: This method issues multiple sequential COUNT queries which
+        Results are cached process-wide for a few seconds, so screens that
+        many users open at once (MOTD, system stats) share one set of counts.
+
+        NOTE: On a miss this issues multiple sequential COUNT queries which
         may become slow as the database grows. For better performance at
         scale, consider:
-        1. Caching stats with a short TTL (e.g., 60 seconds)
-        2. Using a single query with subqueries
-        3. Maintaining a stats table updated by triggers
-        4. Running counts in parallel with asyncio.gather()
+        1. Using a single query with subqueries
+        2. Maintaining a stats table updated by triggers
+        3. Running counts in parallel with asyncio.gather()
         """
+        global _stats_cache
+
+        cached = _stats_cache
+        if cached and time.monotonic() - cached[0] < _STATS_TTL:
+            return dict(cached[1])
+
+        async with _stats_lock:
+            # Another task may have refreshed the cache while we waited
+            cached = _stats_cache
+            if cached and time.monotonic() - cached[0] < _STATS_TTL:
+                return dict(cached[1])
+
+            stats = await self._query_stats()
+            _stats_cache = (time.monotonic(), stats)
+            return dict(stats)
+
+    async def _query_stats(self) -> dict:
         async with get_session() as session:
             total_users = await session.scalar(
                 select(func.count(User.id)).where(User.status == UserStatus.ACTIVE)
@@ -645,24 +849,40 @@ class MailRepository:
             logger.error(f"Failed to send message: {e}")
             return None
 
-    async def get_inbox(self, user_id: int, include_deleted: bool = False) -> List[PrivateMessage]:
+    async def get_inbox(
+        self,
+        user_id: int,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[PrivateMessage]:
+        """Get received messages, with the sender's name attached as msg.other_username"""
         async with get_session() as session:
-            query = select(PrivateMessage).where(
-                PrivateMessage.recipient_id == user_id
+            query = (
+                select(PrivateMessage, User.username)
+                .outerjoin(User, User.id == PrivateMessage.sender_id)
+                .where(PrivateMessage.recipient_id == user_id)
             )
 
             if not include_deleted:
                 query = query.where(PrivateMessage.is_deleted_recipient == False)
 
-            query = query.order_by(PrivateMessage.created_at.desc())
+            query = query.order_by(PrivateMessage.created_at.desc(), PrivateMessage.id.desc())
+            if offset:
+                query = query.offset(offset)
+            if limit is not None:
+                query = query.limit(limit)
 
             result = await session.execute(query)
-            return result.scalars().all()
+            return self._attach_other_username(result.all())
 
     async def get_sent(self, user_id: int, include_deleted: bool = False) -> List[PrivateMessage]:
+        """Get sent messages, with the recipient's name attached as msg.other_username"""
         async with get_session() as session:
-            query = select(PrivateMessage).where(
-                PrivateMessage.sender_id == user_id
+            query = (
+                select(PrivateMessage, User.username)
+                .outerjoin(User, User.id == PrivateMessage.recipient_id)
+                .where(PrivateMessage.sender_id == user_id)
             )
 
             if not include_deleted:
@@ -671,7 +891,15 @@ class MailRepository:
             query = query.order_by(PrivateMessage.created_at.desc())
 
             result = await session.execute(query)
-            return result.scalars().all()
+            return self._attach_other_username(result.all())
+
+    @staticmethod
+    def _attach_other_username(rows: Iterable[Tuple[PrivateMessage, Optional[str]]]) -> List[PrivateMessage]:
+        messages = []
+        for msg, username in rows:
+            msg.other_username = username or "Unknown"
+            messages.append(msg)
+        return messages
 
     async def get_message(self, message_id: int) -> Optional[PrivateMessage]:
         async with get_session() as session:
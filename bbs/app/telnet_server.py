@@ -41,7 +41,8 @@ class TelnetServer:
             if authenticated:
                 session.state = SessionState.AUTHENTICATED
                 await session.writeline(f"\r\n{session.t('login.welcome_back', username=session.username)}")
-                await asyncio.sleep(1)
+                if await session.pause_for(1):
+                    return
 
                 menu = MainMenu(session)
                 await menu.run()
@@ -0,0 +1,77 @@
+"""
+Fallback MOTD banners for LoginUI.
+
+Only imported when the MOTD asset is missing or unreadable, so the banner
+literals stay out of the login hot path.
+"""
+
+from ..session import Session
+
+# Encodings that can display Unicode box drawing characters
+_UTF8_BOX_ENCODINGS = frozenset({'utf-8', 'windows-1251'})
+
+# SGR sequences emitted inline with the banners (same codes as
+# set_color(fg=6, bold=True) and reset_color())
+_SGR_CYAN_BOLD = "\x1b[1;36m"
+_SGR_RESET = "\x1b[0m"
+
+# UTF-8 box drawing
+_BANNER_UTF8 = (
+    "╔══════════════════════════════════════════════╗\r\n"
+    "║                                              ║\r\n"
+    "║         PERESTROIKA BBS SYSTEM               ║\r\n"
+    "║                                              ║\r\n"
+    "║         A Modern Retro Experience            ║\r\n"
+    "║                                              ║\r\n"
+    "╚══════════════════════════════════════════════╝\r\n"
+)
+
+# CP437 box drawing (using extended ASCII)
+_BANNER_CP437 = (
+    b"\xc9" + b"\xcd" * 48 + b"\xbb\r\n"  # ╔═══╗
+    + b"\xba" + b" " * 48 + b"\xba\r\n"   # ║   ║
+    + b"\xba         PERESTROIKA BBS SYSTEM               \xba\r\n"
+    + b"\xba                                                \xba\r\n"
+    + b"\xba         A Modern Retro Experience              \xba\r\n"
+    + b"\xba" + b" " * 48 + b"\xba\r\n"
+    + b"\xc8" + b"\xcd" * 48 + b"\xbc\r\n"  # ╚═══╝
+)
+
+# ASCII fallback
+_BANNER_ASCII = (
+    "+" + "=" * 48 + "+\r\n"
+    "|                                                |\r\n"
+    "|         PERESTROIKA BBS SYSTEM                |\r\n"
+    "|                                                |\r\n"
+    "|         A Modern Retro Experience              |\r\n"
+    "|                                                |\r\n"
+    "+" + "=" * 48 + "+\r\n"
+)
+
+# Plain text for non-ANSI terminals
+_BANNER_PLAIN = (
+    "=" * 50 + "\r\n"
+    "         PERESTROIKA BBS SYSTEM\r\n"
+    "         A Modern Retro Experience\r\n"
+    + "=" * 50 + "\r\n"
+)
+
+
+async def show_default_motd(session: Session, welcome_message: str = "Welcome!") -> None:
+    """Show default MOTD with proper charset support"""
+    if session.capabilities.ansi:
+        # Color codes go out in the same write as the banner
+        color = _SGR_CYAN_BOLD if session.capabilities.color else ""
+
+        # Use appropriate box characters based on encoding
+        encoding = session.capabilities.encoding
+        if encoding in _UTF8_BOX_ENCODINGS:
+            await session.write(color + _BANNER_UTF8 + _SGR_RESET)
+        elif "437" in encoding:
+            await session.write(color.encode("ascii") + _BANNER_CP437 + _SGR_RESET.encode("ascii"))
+        else:
+            await session.write(color + _BANNER_ASCII + _SGR_RESET)
+    else:
+        await session.write(_BANNER_PLAIN)
+
+    await session.write(f"\r\n{welcome_message}\r\n")
@@ -39,7 +39,7 @@ class AdminUI:
         menu.add_item("I", "IP Ban Management", self.ip_ban_management)
         menu.add_item("C", "System Configuration", self.system_config)
         menu.add_item("D", "Database Maintenance", self.database_maintenance)
-        menu.add_item("Q", "Back to Main Menu", lambda: setattr(menu, "running", False))
+        menu.add_item("Q", "Back to Main Menu", exit_menu=True)
 
         await menu.run()
 
@@ -53,7 +53,7 @@ class AdminUI:
         menu.add_item("R", "Reset Password", self.reset_password)
         menu.add_item("A", "Access Level Management", self.manage_access_levels)
         menu.add_item("S", "Search Users", self.search_users)
-        menu.add_item("Q", "Back", lambda: setattr(menu, "running", False))
+        menu.add_item("Q", "Back", exit_menu=True)
 
         await menu.run()
 
@@ -89,7 +89,7 @@ class AdminUI:
         await self.session.writeline()
 
         username = await self.session.readline("Username to edit: ")
-        user = await self.user_repo.get_by_username(username)
+        user = await self.user_repo.get_by_username(username, fresh=True)
 
         if not user:
             await self.session.writeline(f"\r\nUser '{username}' not found.")
@@ -120,7 +120,7 @@ class AdminUI:
         await self.session.writeline()
 
         username = await self.session.readline("Username to delete: ")
-        user = await self.user_repo.get_by_username(username)
+        user = await self.user_repo.get_by_username(username, fresh=True)
 
         if not user:
             await self.session.writeline(f"\r\nUser '{username}' not found.")
@@ -143,7 +143,7 @@ class AdminUI:
         await self.session.writeline()
 
         username = await self.session.readline("Username: ")
-        user = await self.user_repo.get_by_username(username)
+        user = await self.user_repo.get_by_username(username, fresh=True)
 
         if not user:
             await self.session.writeline(f"\r\nUser '{username}' not found.")
@@ -173,7 +173,7 @@ class AdminUI:
         await self.session.writeline()
 
         username = await self.session.readline("Username: ")
-        user = await self.user_repo.get_by_username(username)
+        user = await self.user_repo.get_by_username(username, fresh=True)
 
         if not user:
             await self.session.writeline(f"\r\nUser '{username}' not found.")
@@ -210,7 +210,7 @@ class AdminUI:
         await self.session.writeline()
 
         username = await self.session.readline("Username to modify: ")
-        user = await self.user_repo.get_by_username(username)
+        user = await self.user_repo.get_by_username(username, fresh=True)
 
         if not user:
             await self.session.writeline(f"\r\nUser '{username}' not found.")
@@ -258,7 +258,7 @@ class AdminUI:
         menu.add_item("E", "Edit Board", self.edit_board)
         menu.add_item("D", "Delete Board", self.delete_board)
         menu.add_item("P", "Prune Old Posts", self.prune_posts)
-        menu.add_item("Q", "Back", lambda: setattr(menu, "running", False))
+        menu.add_item("Q", "Back", exit_menu=True)
 
         await menu.run()
 
@@ -1034,7 +1034,7 @@ class AdminUI:
         menu.add_item("A", "Add IP Ban", self._add_ip_ban)
         menu.add_item("R", "Remove IP Ban", self._remove_ip_ban)
         menu.add_item("C", "Check IP Status", self._check_ip_status)
-        menu.add_item("Q", "Back", lambda: setattr(menu, "running", False))
+        menu.add_item("Q", "Back", exit_menu=True)
         await menu.run()
 
     async def _list_banned_ips(self) -> None:
@@ -1207,7 +1207,8 @@ class AdminUI:
         await self.session.writeline()
 
         try:
-            import toml
+            import tomllib
+            import tomli_w
             from pathlib import Path
 
             config_path = Path("/home/dp/src/perestroikabbs/config.toml")
@@ -1222,8 +1223,8 @@ class AdminUI:
                 return
 
             # Load current config
-            with open(config_path, 'r') as f:
-                config = toml.load(f)
+            with open(config_path, 'rb') as f:
+                config = tomllib.load(f)
 
             # Display main settings
             await self.session.writeline("Current Configuration:")
@@ -1282,8 +1283,8 @@ class AdminUI:
                 new_name = await self.session.readline("New BBS name: ")
                 if new_name:
                     config['bbs']['name'] = new_name
-                    with open(config_path, 'w') as f:
-                        toml.dump(config, f)
+                    with open(config_path, 'wb') as f:
+                        tomli_w.dump(config, f)
                     await self.session.writeline("\r\nBBS name updated. Restart required.")
 
             elif choice == "2":
@@ -1292,8 +1293,8 @@ class AdminUI:
                     port = int(new_port)
                     if 1 <= port <= 65535:
                         config['bbs']['port'] = port
-                        with open(config_path, 'w') as f:
-                            toml.dump(config, f)
+                        with open(config_path, 'wb') as f:
+                            tomli_w.dump(config, f)
                         await self.session.writeline("\r\nPort updated. Restart required.")
                     else:
                         await self.session.writeline("\r\nInvalid port number.")
@@ -1305,8 +1306,8 @@ class AdminUI:
                 new_level = await self.session.readline("New log level: ").upper()
                 if new_level in ['DEBUG', 'INFO', 'WARNING', 'ERROR']:
                     config['logging']['level'] = new_level
-                    with open(config_path, 'w') as f:
-                        toml.dump(config, f)
+                    with open(config_path, 'wb') as f:
+                        tomli_w.dump(config, f)
                     await self.session.writeline("\r\nLog level updated. Restart required.")
                 else:
                     await self.session.writeline("\r\nInvalid log level.")
@@ -28,7 +28,7 @@ class BoardsUI:
 
         menu.add_item("N", "New Post", self.new_post)
         menu.add_item("S", "Search", self.search_posts)
-        menu.add_item("Q", "Back", lambda: setattr(menu, "running", False))
+        menu.add_item("Q", "Back", exit_menu=True)
 
         await menu.run()
 
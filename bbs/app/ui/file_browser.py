@@ -33,7 +33,7 @@ class FileBrowser:
 
         menu.add_item("U", self.session.t('files.upload'), self.upload_file)
         menu.add_item("S", self.session.t('files.search'), self.search_files)
-        menu.add_item("Q", self.session.t('common.back'), lambda: setattr(menu, "running", False))
+        menu.add_item("Q", self.session.t('common.back'), exit_menu=True)
 
         await menu.run()
 
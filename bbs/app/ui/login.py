@@ -1,24 +1,66 @@
 import asyncio
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
 from ..encoding import CharsetManager
 from ..session import Session
-from ..storage.repositories import UserRepository
+from ..storage.repositories import SystemRepository, UserRepository
 from ..security.auth import AuthManager
 from ..utils.logger import get_logger
 from ..utils.config import get_config
 
 logger = get_logger("ui.login")
 
+_APP_DIR = Path(__file__).resolve().parent.parent
+_ASSETS_DIR = _APP_DIR / "assets"
+_WELCOME_TEMPLATE = _APP_DIR / "templates" / "templates" / "welcome.j2"
+
+# Encodings that can display native (non-Latin) language names
+_UNICODE_CAPABLE_ENCODINGS = frozenset({'utf-8', 'windows-1251', 'koi8-r'})
+
+# Display mode menu, sent together with its input prompt in a single write
+_DISPLAY_MODE_PROMPT = (
+    "\r\n"
+    "Select your terminal configuration:\r\n"
+    "\r\n"
+    "  [1] 80x24 with ANSI colors (Recommended)\r\n"
+    "  [2] 80x24 plain text (No colors)\r\n"
+    "  [3] 40x24 with ANSI colors (Narrow color)\r\n"
+    "  [4] 40x24 plain text (Narrow, no colors)\r\n"
+    "\r\n"
+    "Selection [1]: "
+)
+
+# Display mode choice -> (cols, rows, ansi, confirmation text)
+_DISPLAY_MODES = {
+    "1": (80, 24, True, "80x24 with ANSI colors"),    # Standard ANSI
+    "2": (80, 24, False, "80x24 plain text"),         # Standard Plain
+    "3": (40, 24, True, "40x24 with ANSI colors"),    # Narrow ANSI
+    "4": (40, 24, False, "40x24 plain text"),         # Narrow Plain
+}
+
+
+@lru_cache(maxsize=4)
+def _read_motd_variants(path_str: str) -> tuple[bytes, str]:
+    """Read a MOTD asset as (raw bytes, UTF-8 decoded text), cached since assets don't change at runtime"""
+    raw = Path(path_str).read_bytes()
+    return raw, raw.decode("utf-8", errors="replace")
+
 
 class LoginUI:
     def __init__(self, session: Session, charset_manager: CharsetManager):
         self.session = session
         self.charset_manager = charset_manager
+        self.config = get_config()
         self.auth_manager = AuthManager()
         self.user_repo = UserRepository()
         self.max_attempts = 3
+        self._choice_handlers = {
+            "L": self.login,
+            "N": self.register,
+            "G": self.guest_login,
+        }
 
     async def run(self) -> bool:
         # 0. Show ASCII-only welcome screen (works on ANY terminal)
@@ -37,31 +79,19 @@ class LoginUI:
         await self.show_motd_template()
 
         await self.session.writeline()
-        await self.session.writeline(self.session.t('login.title'))
+        await self.session.writeline(self.session.login_strings.login_title)
         await self.session.writeline()
 
-        options = [
-            ("L", self.session.t('login.login_option')),
-            ("N", self.session.t('login.register_option')),
-            ("G", self.session.t('login.guest_option')),
-            ("Q", self.session.t('login.quit_option')),
-        ]
-
-        choice = await self.session.menu_select(options, f"\r\n{self.session.t('login.your_choice')}: ")
-
-        if choice == "L":
-            return await self.login()
-        elif choice == "N":
-            return await self.register()
-        elif choice == "G":
-            return await self.guest_login()
-        else:
-            return False
+        options = self.session.translated_login_menu()
+
+        choice = await self.session.menu_select(options, f"\r\n{self.session.login_strings.login_your_choice}: ")
+
+        handler = self._choice_handlers.get(choice)
+        return await handler() if handler else False
 
     async def select_language(self) -> None:
         """Allow user to select interface language - now charset is known"""
-        config = get_config()
-        supported = config.language.supported_languages
+        supported = self.config.language.supported_languages
 
         # Language metadata: code -> (english_name, native_name)
         LANGUAGE_META = {
@@ -75,70 +105,68 @@ class LoginUI:
             "uk": ("Ukrainian", "Українська"),
         }
 
-        await self.session.writeline()
-
         # Check if we can display unicode characters
-        can_show_unicode = self.session.capabilities.encoding in ['utf-8', 'windows-1251', 'koi8-r']
+        can_show_unicode = self.session.capabilities.encoding in _UNICODE_CAPABLE_ENCODINGS
 
+        lines = [""]
         if can_show_unicode:
-            await self.session.writeline("Select your language / Выберите язык:")
+            lines.append("Select your language / Выберите язык:")
         else:
-            await self.session.writeline("Select your language:")
-
-        await self.session.writeline()
+            lines.append("Select your language:")
+        lines.append("")
 
         for i, lang_code in enumerate(supported, 1):
             eng_name, native_name = LANGUAGE_META.get(lang_code, (lang_code, lang_code))
             if can_show_unicode and native_name != eng_name:
-                await self.session.writeline(f"  [{i}] {native_name} ({eng_name})")
+                lines.append(f"  [{i}] {native_name} ({eng_name})")
             else:
-                await self.session.writeline(f"  [{i}] {eng_name}")
+                lines.append(f"  [{i}] {eng_name}")
 
-        await self.session.writeline()
+        lines.append("")
+        lines.append(f"Choice [1-{len(supported)}]: ")
 
-        choice = await self.session.readline(f"Choice [1-{len(supported)}]: ")
+        # Menu and prompt go out as one write
+        choice = await self.session.readline("\r\n".join(lines))
 
         try:
             idx = int(choice) - 1
             if 0 <= idx < len(supported):
                 self.session.set_language(supported[idx])
             else:
-                self.session.set_language(config.language.default_language)
+                self.session.set_language(self.config.language.default_language)
         except ValueError:
-            self.session.set_language(config.language.default_language)
+            self.session.set_language(self.config.language.default_language)
 
     async def select_encoding(self) -> None:
         # Use simple ASCII for charset selection since we don't know encoding yet
         logger.info(f"Starting charset selection for session {self.session.id}")
 
-        config = get_config()
-        preview_text = config.charset.charset_preview_text
-        preview_translit = config.charset.charset_preview_translit
-
-        await self.session.writeline("\r\nSelect charset (find the line with correct text):")
-        await self.session.writeline()
+        preview_text = self.config.charset.charset_preview_text
+        preview_translit = self.config.charset.charset_preview_translit
 
         encodings = self.charset_manager.get_encoding_menu()
 
+        # Build the whole preview table and send it in one write
+        frame = bytearray(b"\r\nSelect charset (find the line with correct text):\r\n\r\n")
+
         for i, (display, encoding) in enumerate(encodings, 1):
             # Build line prefix (ASCII-safe)
-            prefix = f" [{i}] {display}: "
+            prefix = f" [{i}] {display}: ".encode('ascii', errors='replace')
 
             if encoding == "ascii":
                 # Show transliteration for 7-bit ASCII
-                await self.session.writeline(prefix + preview_translit)
+                frame += prefix + preview_translit.encode('ascii', errors='replace')
             else:
-                # Encode preview text in this encoding and send raw bytes
+                # Encode preview text in this encoding as raw bytes, bypassing
+                # session encoding (which would mangle the bytes)
                 try:
-                    encoded_bytes = preview_text.encode(encoding, errors='replace')
-                    # Send prefix + raw encoded bytes + newline via write_raw
-                    # to bypass session encoding (which would mangle the bytes)
-                    line_bytes = prefix.encode('ascii') + encoded_bytes + b'\r\n'
-                    await self.session.write_raw(line_bytes)
+                    frame += prefix + preview_text.encode(encoding, errors='replace')
                 except Exception:
-                    await self.session.writeline(prefix + "(encoding error)")
+                    frame += prefix + b"(encoding error)"
+            frame += b"\r\n"
 
-        await self.session.writeline()
+        frame += b"\r\n"
+        await self.session.write_raw(bytes(frame))
 
         while True:
             choice = await self.session.readline(f"Choice [1-{len(encodings)}]: ")
@@ -156,32 +184,16 @@ class LoginUI:
                     await self.session.writeline(f"Encoding set to {encodings[idx - 1][0]}")
                     break
                 else:
-                    await self.session.writeline(self.session.t('common.invalid_choice'))
+                    await self.session.writeline(self.session.login_strings.common_invalid_choice)
 
             except ValueError:
-                await self.session.writeline(self.session.t('common.invalid_input'))
+                await self.session.writeline(self.session.login_strings.common_invalid_input)
 
     async def select_display_mode(self) -> None:
         """Allow user to select terminal display mode (size + ANSI support)"""
-        await self.session.writeline()
-        await self.session.writeline("Select your terminal configuration:")
-        await self.session.writeline()
-        await self.session.writeline("  [1] 80x24 with ANSI colors (Recommended)")
-        await self.session.writeline("  [2] 80x24 plain text (No colors)")
-        await self.session.writeline("  [3] 40x24 with ANSI colors (Narrow color)")
-        await self.session.writeline("  [4] 40x24 plain text (Narrow, no colors)")
-        await self.session.writeline()
-
-        choice = await self.session.readline("Selection [1]: ")
+        choice = await self.session.readline(_DISPLAY_MODE_PROMPT)
 
-        configs = {
-            "1": (80, 24, True),   # Standard ANSI
-            "2": (80, 24, False),  # Standard Plain
-            "3": (40, 24, True),   # Narrow ANSI
-            "4": (40, 24, False),  # Narrow Plain
-        }
-
-        cols, rows, ansi = configs.get(choice, configs["1"])
+        cols, rows, ansi, description = _DISPLAY_MODES.get(choice) or _DISPLAY_MODES["1"]
 
         self.session.capabilities.cols = cols
         self.session.capabilities.rows = rows
@@ -191,33 +203,26 @@ class LoginUI:
         # Update display mode
         self.session.update_display_mode()
 
-        mode_descriptions = {
-            "1": "80x24 with ANSI colors",
-            "2": "80x24 plain text",
-            "3": "40x24 with ANSI colors",
-            "4": "40x24 plain text"
-        }
-
-        await self.session.writeline(f"\n{mode_descriptions.get(choice, mode_descriptions['1'])} selected")
+        await self.session.writeline(f"\n{description} selected")
 
     async def login(self) -> bool:
         for attempt in range(self.max_attempts):
             await self.session.writeline()
-            username = await self.session.readline(f"{self.session.t('login.username_prompt')}: ")
+            username = await self.session.readline(f"{self.session.login_strings.login_username_prompt}: ")
 
             if not username:
                 continue
 
-            password = await self.session.read_password(f"{self.session.t('login.password_prompt')}: ")
+            password = await self.session.read_password(f"{self.session.login_strings.login_password_prompt}: ")
 
-            user = await self.user_repo.get_by_username(username)
+            user = await self.user_repo.get_by_username(username, fresh=True)
 
             if user:
                 valid, needs_rehash = await self.auth_manager.verify_password(
                     password, user.password_hash
                 )
                 if not valid:
-                    await self.session.writeline(f"\r\n{self.session.t('login.invalid_credentials')}")
+                    await self.session.writeline(f"\r\n{self.session.login_strings.login_invalid_credentials}")
                     if attempt < self.max_attempts - 1:
                         await self.session.writeline(self.session.t('login.attempts_remaining', count=self.max_attempts - attempt - 1))
                     await asyncio.sleep(1)
@@ -238,55 +243,55 @@ class LoginUI:
                 return True
 
             else:
-                await self.session.writeline(f"\r\n{self.session.t('login.invalid_credentials')}")
+                await self.session.writeline(f"\r\n{self.session.login_strings.login_invalid_credentials}")
                 if attempt < self.max_attempts - 1:
                     await self.session.writeline(self.session.t('login.attempts_remaining', count=self.max_attempts - attempt - 1))
                 await asyncio.sleep(1)
 
-        await self.session.writeline(f"\r\n{self.session.t('login.max_attempts')}")
+        await self.session.writeline(f"\r\n{self.session.login_strings.login_max_attempts}")
         return False
 
     async def register(self) -> bool:
         await self.session.writeline()
-        await self.session.writeline(self.session.t('register.title'))
+        await self.session.writeline(self.session.login_strings.register_title)
         await self.session.writeline()
 
         while True:
-            username = await self.session.readline(f"{self.session.t('register.username_prompt')}: ")
+            username = await self.session.readline(f"{self.session.login_strings.register_username_prompt}: ")
 
             if len(username) < 3:
-                await self.session.writeline(self.session.t('register.username_short'))
+                await self.session.writeline(self.session.login_strings.register_username_short)
                 continue
 
             if len(username) > 20:
-                await self.session.writeline(self.session.t('register.username_long'))
+                await self.session.writeline(self.session.login_strings.register_username_long)
                 continue
 
             if await self.user_repo.get_by_username(username):
-                await self.session.writeline(self.session.t('register.username_taken'))
+                await self.session.writeline(self.session.login_strings.register_username_taken)
                 continue
 
             break
 
         while True:
-            password = await self.session.read_password(f"{self.session.t('register.password_prompt')}: ")
+            password = await self.session.read_password(f"{self.session.login_strings.register_password_prompt}: ")
 
             if len(password) < 8:
-                await self.session.writeline(f"\r\n{self.session.t('register.password_short')}")
+                await self.session.writeline(f"\r\n{self.session.login_strings.register_password_short}")
                 continue
 
-            confirm = await self.session.read_password(f"{self.session.t('register.password_confirm')}: ")
+            confirm = await self.session.read_password(f"{self.session.login_strings.register_password_confirm}: ")
 
             if password != confirm:
-                await self.session.writeline(f"\r\n{self.session.t('register.password_mismatch')}")
+                await self.session.writeline(f"\r\n{self.session.login_strings.register_password_mismatch}")
                 continue
 
             break
 
         await self.session.writeline()
-        email = await self.session.readline(f"{self.session.t('register.email_prompt')}: ")
-        real_name = await self.session.readline(f"{self.session.t('register.realname_prompt')}: ")
-        location = await self.session.readline(f"{self.session.t('register.location_prompt')}: ")
+        email = await self.session.readline(f"{self.session.login_strings.register_email_prompt}: ")
+        real_name = await self.session.readline(f"{self.session.login_strings.register_realname_prompt}: ")
+        location = await self.session.readline(f"{self.session.login_strings.register_location_prompt}: ")
 
         password_hash = await self.auth_manager.hash_password(password)
 
@@ -309,13 +314,13 @@ class LoginUI:
             return True
 
         else:
-            await self.session.writeline(f"\r\n{self.session.t('register.failed')}")
+            await self.session.writeline(f"\r\n{self.session.login_strings.register_failed}")
             return False
 
     async def guest_login(self) -> bool:
         self.session.username = "Guest"
         self.session.access_level = 0
-        await self.session.writeline(f"\r\n{self.session.t('login.guest_login')}")
+        await self.session.writeline(f"\r\n{self.session.login_strings.login_guest_login}")
         logger.info(f"Guest login (Session: {self.session.id})")
         return True
 
@@ -323,21 +328,21 @@ class LoginUI:
         """Display MOTD after charset, language, and terminal are configured"""
         await self.session.clear_screen()
 
-        config = get_config()
-        motd_file = config.server.motd_asset
+        motd_file = self.config.server.motd_asset
 
         try:
-            motd_path = Path(__file__).parent.parent / "assets" / motd_file
+            motd_path = _ASSETS_DIR / motd_file
 
             if motd_path.exists():
-                with open(motd_path, "rb") as f:
-                    content = f.read()
+                # Read off the event loop so other sessions aren't stalled
+                loop = asyncio.get_running_loop()
+                raw, text = await loop.run_in_executor(None, _read_motd_variants, str(motd_path))
 
                 # Display based on configured encoding
-                if self.session.capabilities.encoding == "cp437" or "437" in self.session.capabilities.encoding:
-                    await self.session.write(content)
+                if "437" in self.session.capabilities.encoding:
+                    await self.session.write(raw)
                 else:
-                    await self.session.write(content.decode("utf-8", errors="replace"))
+                    await self.session.write(text)
             else:
                 await self.show_default_motd()
         except Exception as e:
@@ -351,10 +356,9 @@ class LoginUI:
         # Clear screen before showing MOTD
         await self.session.clear_screen()
 
-        # Get system stats for the template
-        from ..storage.repositories import SystemRepository
+        # Get system stats and news for the template (independent queries)
         sys_repo = SystemRepository()
-        stats = await sys_repo.get_stats()
+        stats, news = await asyncio.gather(sys_repo.get_stats(), self._get_system_news())
 
         # Get mgetty connection info if available
         mgetty = self.session.data.get('mgetty')
@@ -365,7 +369,7 @@ class LoginUI:
             'online_now': stats.get('active_sessions', 0),
             'messages_today': stats.get('messages_today', 0),
             'files_shared': stats.get('total_files', 0),
-            'system_news': await self._get_system_news(),
+            'system_news': news,
             # Connection info (only if not empty)
             'caller_id': (mgetty.caller_id if mgetty and mgetty.caller_id else ''),
             'caller_name': (mgetty.caller_name if mgetty and mgetty.caller_name else ''),
@@ -386,50 +390,12 @@ class LoginUI:
         return "Welcome to the new template-based BBS system!"
 
     async def show_default_motd(self) -> None:
-        """Show default MOTD with proper charset support"""
-        if self.session.capabilities.ansi:
-            await self.session.set_color(fg=6, bold=True)
-
-            # Use appropriate box characters based on encoding
-            if self.session.capabilities.encoding in ["utf-8", "windows-1251"]:
-                # UTF-8 box drawing
-                await self.session.writeline("╔══════════════════════════════════════════════╗")
-                await self.session.writeline("║                                              ║")
-                await self.session.writeline("║         PERESTROIKA BBS SYSTEM               ║")
-                await self.session.writeline("║                                              ║")
-                await self.session.writeline("║         A Modern Retro Experience            ║")
-                await self.session.writeline("║                                              ║")
-                await self.session.writeline("╚══════════════════════════════════════════════╝")
-            elif "437" in self.session.capabilities.encoding or self.session.capabilities.encoding == "cp437":
-                # CP437 box drawing (using extended ASCII)
-                await self.session.write(b"\xc9" + b"\xcd" * 48 + b"\xbb\r\n")  # ╔═══╗
-                await self.session.write(b"\xba" + b" " * 48 + b"\xba\r\n")     # ║   ║
-                await self.session.write(b"\xba         PERESTROIKA BBS SYSTEM               \xba\r\n")
-                await self.session.write(b"\xba                                                \xba\r\n")
-                await self.session.write(b"\xba         A Modern Retro Experience              \xba\r\n")
-                await self.session.write(b"\xba" + b" " * 48 + b"\xba\r\n")
-                await self.session.write(b"\xc8" + b"\xcd" * 48 + b"\xbc\r\n")  # ╚═══╝
-            else:
-                # ASCII fallback
-                await self.session.writeline("+" + "=" * 48 + "+")
-                await self.session.writeline("|                                                |")
-                await self.session.writeline("|         PERESTROIKA BBS SYSTEM                |")
-                await self.session.writeline("|                                                |")
-                await self.session.writeline("|         A Modern Retro Experience              |")
-                await self.session.writeline("|                                                |")
-                await self.session.writeline("+" + "=" * 48 + "+")
-
-            await self.session.reset_color()
-        else:
-            # Plain text for non-ANSI terminals
-            await self.session.writeline("=" * 50)
-            await self.session.writeline("         PERESTROIKA BBS SYSTEM")
-            await self.session.writeline("         A Modern Retro Experience")
-            await self.session.writeline("=" * 50)
+        """Show default MOTD banner (loaded lazily, only needed on fallback)"""
+        from ._login_fallback import show_default_motd
 
-        await self.session.writeline()
-        config = get_config()
-        await self.session.writeline(config.server.welcome_message if hasattr(config.server, 'welcome_message') else "Welcome!")
+        server_config = self.config.server
+        welcome = server_config.welcome_message if hasattr(server_config, 'welcome_message') else "Welcome!"
+        await show_default_motd(self.session, welcome)
 
     async def show_welcome(self) -> None:
         """Show ASCII-only welcome screen before charset selection
@@ -438,26 +404,29 @@ class LoginUI:
         including ancient terminals that don't support extended ASCII.
         """
         # Load the welcome template directly as it's pure ASCII
-        from pathlib import Path
-        template_path = Path(__file__).parent.parent / "templates" / "templates" / "welcome.j2"
-
-        if template_path.exists():
-            with open(template_path, 'r', encoding='ascii', errors='ignore') as f:
+        if _WELCOME_TEMPLATE.exists():
+            with open(_WELCOME_TEMPLATE, 'r', encoding='ascii', errors='ignore') as f:
                 content = f.read()
             # Remove Jinja2 comments
-            lines = [line for line in content.split('\n') if not line.strip().startswith('{#')]
-            await self.session.write('\r\n'.join(lines))
+            await self.session.write(
+                '\r\n'.join(
+                    line for line in content.split('\n')
+                    if not line.lstrip(' \t').startswith('{#')
+                )
+            )
         else:
             # Fallback if template not found
-            await self.session.writeline()
-            await self.session.writeline("    +-----------------------+")
-            await self.session.writeline("    |   PERESTROIKA BBS     |")
-            await self.session.writeline("    |   ===============     |")
-            await self.session.writeline("    |                       |")
-            await self.session.writeline("    |    Modern Retro       |")
-            await self.session.writeline("    |     Experience        |")
-            await self.session.writeline("    +-----------------------+")
-            await self.session.writeline()
-            await self.session.writeline("    Welcome to the system!")
+            await self.session.write(
+                "\r\n"
+                "    +-----------------------+\r\n"
+                "    |   PERESTROIKA BBS     |\r\n"
+                "    |   ===============     |\r\n"
+                "    |                       |\r\n"
+                "    |    Modern Retro       |\r\n"
+                "    |     Experience        |\r\n"
+                "    +-----------------------+\r\n"
+                "\r\n"
+                "    Welcome to the system!\r\n"
+            )
 
         await self.session.writeline()
\ No newline at end of file
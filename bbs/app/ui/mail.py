@@ -1,14 +1,21 @@
-from datetime import datetime
-from typing import List, Optional
+from typing import List
 
 from ..session import Session
 from ..storage.models import PrivateMessage
 from ..storage.repositories import MailRepository, UserRepository
+from ..utils.formatting import format_minute
 from ..utils.logger import get_logger
 from .menu import Menu
 
 logger = get_logger("ui.mail")
 
+# Listing row formats, bound once instead of re-parsing pad specs per row
+_INBOX_FMT = "{:<4} {:<15} {:<30} {:<20} {:<5}".format
+_SENT_FMT = "{:<4} {:<15} {:<30} {:<20}".format
+
+# Inbox messages fetched and listed per page
+_INBOX_PAGE_SIZE = 40
+
 
 class MailUI:
     def __init__(self, session: Session):
@@ -22,47 +29,70 @@ class MailUI:
         menu.add_item("I", self.session.t('mail.inbox'), self.inbox)
         menu.add_item("S", self.session.t('mail.sent'), self.sent)
         menu.add_item("C", self.session.t('mail.compose'), self.compose)
-        menu.add_item("Q", self.session.t('common.back'), lambda: setattr(menu, "running", False))
+        menu.add_item("Q", self.session.t('common.back'), exit_menu=True)
 
         await menu.run()
 
     async def inbox(self) -> None:
-        await self.session.clear_screen()
-        await self.session.writeline("=== Inbox ===")
-        await self.session.writeline()
-
         if not self.session.user_id:
-            await self.session.writeline("You must be logged in to view mail.")
+            await self.session.clear_screen()
+            await self.session.write("=== Inbox ===\r\n\r\nYou must be logged in to view mail.\r\n")
             await self.session.read(1)
             return
 
-        # Get messages for current user
-        messages = await self.mail_repo.get_inbox(self.session.user_id)
+        page = 0
+        while True:
+            # Fetch one extra row to know whether a next page exists
+            messages = await self.mail_repo.get_inbox(
+                self.session.user_id, limit=_INBOX_PAGE_SIZE + 1, offset=page * _INBOX_PAGE_SIZE
+            )
+            if not messages and page:
+                # Page emptied by deletions, step back
+                page -= 1
+                continue
 
-        if not messages:
-            await self.session.writeline("No messages in inbox.")
-        else:
-            await self.session.writeline(f"{'#':<4} {'From':<15} {'Subject':<30} {'Date':<20} {'Read':<5}")
-            await self.session.writeline("-" * 75)
+            has_next = len(messages) > _INBOX_PAGE_SIZE
+            messages = messages[:_INBOX_PAGE_SIZE]
 
-            for i, msg in enumerate(messages, 1):
-                sender = await self.user_repo.get_by_id(msg.sender_id)
-                sender_name = sender.username if sender else "Unknown"
-                date_str = msg.created_at.strftime("%Y-%m-%d %H:%M")
-                read_status = "Yes" if msg.read_at else "No"
+            await self.session.clear_screen()
+            lines = ["=== Inbox ===" if not page else f"=== Inbox (page {page + 1}) ===", ""]
 
-                await self.session.writeline(
-                    f"{i:<4} {sender_name:<15} {msg.subject[:29]:<30} {date_str:<20} {read_status:<5}"
-                )
+            if not messages:
+                lines.append("No messages in inbox.")
+            else:
+                lines.append(_INBOX_FMT('#', 'From', 'Subject', 'Date', 'Read'))
+                lines.append("-" * 75)
 
-        await self.session.writeline()
-        await self.session.writeline("Commands: [R]ead, [D]elete, [Q]uit")
+                for i, msg in enumerate(messages, 1):
+                    date_str = format_minute(msg.created_at)
+                    read_status = "Yes" if msg.read_at else "No"
+                    lines.append(_INBOX_FMT(i, msg.other_username, msg.subject[:29], date_str, read_status))
+
+            commands = ["[R]ead", "[D]elete"]
+            if has_next:
+                commands.append("[N]ext page")
+            if page:
+                commands.append("[P]revious page")
+            commands.append("[Q]uit")
 
-        choice = await self.session.readline(f"{self.session.t('login.your_choice')}: ")
+            lines.append("")
+            lines.append(f"Commands: {', '.join(commands)}")
 
-        if choice.upper() == "R" and messages:
+            # Send the whole listing in one write
+            await self.session.write("\r\n".join(lines) + "\r\n")
+
+            choice = (await self.session.readline(f"{self.session.t('login.your_choice')}: ")).upper()
+
+            if choice == "N" and has_next:
+                page += 1
+            elif choice == "P" and page:
+                page -= 1
+            else:
+                break
+
+        if choice == "R" and messages:
             await self.read_message(messages)
-        elif choice.upper() == "D" and messages:
+        elif choice == "D" and messages:
             await self.delete_message(messages)
 
     async def sent(self) -> None:
@@ -79,42 +109,38 @@ class MailUI:
         messages = await self.mail_repo.get_sent(self.session.user_id)
 
         if not messages:
-            await self.session.writeline("No sent messages.")
+            lines = ["No sent messages."]
         else:
-            await self.session.writeline(f"{'#':<4} {'To':<15} {'Subject':<30} {'Date':<20}")
-            await self.session.writeline("-" * 70)
+            lines = [_SENT_FMT('#', 'To', 'Subject', 'Date'), "-" * 70]
 
             for i, msg in enumerate(messages, 1):
-                recipient = await self.user_repo.get_by_id(msg.recipient_id)
-                recipient_name = recipient.username if recipient else "Unknown"
-                date_str = msg.created_at.strftime("%Y-%m-%d %H:%M")
+                date_str = format_minute(msg.created_at)
+                lines.append(_SENT_FMT(i, msg.other_username, msg.subject[:29], date_str))
 
-                await self.session.writeline(
-                    f"{i:<4} {recipient_name:<15} {msg.subject[:29]:<30} {date_str:<20}"
-                )
+        lines.append("")
+        lines.append("Press any key to continue...")
 
-        await self.session.writeline("\r\nPress any key to continue...")
+        # Send the whole listing in one write
+        await self.session.write("\r\n".join(lines) + "\r\n")
         await self.session.read(1)
 
     async def compose(self) -> None:
         await self.session.clear_screen()
-        await self.session.writeline("=== Compose Message ===")
-        await self.session.writeline()
 
         if not self.session.user_id:
-            await self.session.writeline("You must be logged in to send mail.")
+            await self.session.write("=== Compose Message ===\r\n\r\nYou must be logged in to send mail.\r\n")
             await self.session.read(1)
             return
 
-        recipient = await self.session.readline("To (username): ")
+        # Header and first prompt go out in one write
+        recipient = await self.session.readline("=== Compose Message ===\r\n\r\nTo (username): ")
         if not recipient:
             await self.session.writeline("Message cancelled.")
             return
 
         user = await self.user_repo.get_by_username(recipient)
         if not user:
-            await self.session.writeline(f"User '{recipient}' not found.")
-            await self.session.writeline("\r\nPress any key to continue...")
+            await self.session.write(f"User '{recipient}' not found.\r\n\r\nPress any key to continue...\r\n")
             await self.session.read(1)
             return
 
@@ -142,14 +168,11 @@ class MailUI:
                 body=body
             )
 
-            if message:
-                await self.session.writeline("\r\nMessage sent successfully!")
-            else:
-                await self.session.writeline("\r\nError sending message.")
+            result = "Message sent successfully!" if message else "Error sending message."
         else:
-            await self.session.writeline("\r\nMessage cancelled.")
+            result = "Message cancelled."
 
-        await self.session.writeline("\r\nPress any key to continue...")
+        await self.session.write(f"\r\n{result}\r\n\r\nPress any key to continue...\r\n")
         await self.session.read(1)
 
     async def read_message(self, messages: List[PrivateMessage]) -> None:
@@ -166,20 +189,20 @@ class MailUI:
                 await self.session.writeline("=== Message ===")
                 await self.session.writeline()
 
-                sender = await self.user_repo.get_by_id(msg.sender_id)
-                sender_name = sender.username if sender else "Unknown"
+                # Resolved by the inbox query, no need to look the sender up again
+                sender_name = msg.other_username
 
                 await self.session.writeline(f"From: {sender_name}")
-                await self.session.writeline(f"Date: {msg.created_at.strftime('%Y-%m-%d %H:%M')}")
+                await self.session.writeline(f"Date: {format_minute(msg.created_at)}")
                 await self.session.writeline(f"Subject: {msg.subject}")
                 await self.session.writeline("-" * 50)
                 await self.session.writeline()
                 await self.session.writeline(msg.body)
                 await self.session.writeline()
 
-                # Mark as read
+                # Mark as read in the background, the user doesn't wait on it
                 if not msg.read_at:
-                    await self.mail_repo.mark_as_read(msg.id)
+                    self.session.spawn(self.mail_repo.mark_as_read(msg.id))
 
                 await self.session.writeline("-" * 50)
                 await self.session.writeline("Commands: [R]eply, [D]elete, [Q]uit")
@@ -1,12 +1,62 @@
 import asyncio
-import inspect
+import sys
+from collections import OrderedDict
 from typing import Callable, Dict, List, Optional, Tuple
 
-from ..session import Session, SessionState
+from ..exceptions import ConnectionClosedError
+from ..i18n.translit import transliterate
+from ..session import Session
+from ..storage.repositories import SystemRepository, UserRepository
+from ..utils.formatting import format_minute
 from ..utils.logger import get_logger
 
 logger = get_logger("ui.menu")
 
+# SGR codes inlined into menu frames (same as set_color()/reset_color() emit)
+_SGR_YELLOW_BOLD = "\x1b[1;33m"
+_SGR_CYAN = "\x1b[36m"
+_SGR_WHITE = "\x1b[37m"
+_SGR_RESET = "\x1b[0m"
+
+# Help screen layout as (prefix, translation key); None marks a blank line
+_HELP_LINES = (
+    ("", 'help.title'),
+    ("", None),
+    ("", 'help.navigation'),
+    ("  - ", 'help.nav_text'),
+    ("  - ", 'help.nav_enter'),
+    ("", None),
+    ("", 'help.features'),
+    ("  - ", 'help.feat_boards'),
+    ("  - ", 'help.feat_mail'),
+    ("  - ", 'help.feat_chat'),
+    ("  - ", 'help.feat_files'),
+    ("", None),
+    ("", 'help.commands'),
+    ("  - ", 'help.cmd_interrupt'),
+    ("  - ", 'help.cmd_pause'),
+    ("", None),
+    ("", 'common.continue'),
+)
+
+# (language, seven_bit) -> rendered help screen, shared by all sessions
+_help_cache: Dict[Tuple[str, bool], str] = {}
+
+# Plain-text (non-ANSI) frame rules
+_SEP_EQ = "=" * 40
+_SEP_DASH = "-" * 40
+
+_PRESS_ANY = "Press any key to continue..."
+
+# User list row format, bound once instead of re-parsing pad specs per row
+_USER_ROW = "{:<20} {:<20} {:<20}".format
+
+# Frames kept per menu (one per terminal setup/access level seen)
+_FRAME_CACHE_MAX = 8
+# Frames kept per shared MainMenu cache, which serves every session with the
+# same labels and so sees many more terminal/access combinations
+_SHARED_FRAME_CACHE_MAX = 128
+
 
 class MenuItem:
     def __init__(
@@ -16,12 +66,16 @@ class MenuItem:
         handler: Optional[Callable] = None,
         min_access: int = 0,
         submenu: Optional["Menu"] = None,
+        exit_menu: bool = False,
     ):
-        self.key = key.upper()
+        # Interned so choice lookups can match on identity
+        self.key = sys.intern(key.upper())
         self.label = label
         self.handler = handler
         self.min_access = min_access
         self.submenu = submenu
+        # "Back" item: leaves the menu's run loop without calling a handler
+        self.exit_menu = exit_menu
 
 
 class Menu:
@@ -30,6 +84,15 @@ class Menu:
         self.title = title
         self.items: List[MenuItem] = []
         self.running = True
+        # Encoded frames keyed by terminal settings, access level, language and title
+        self._frame_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._frame_cache_max = _FRAME_CACHE_MAX
+        self._prompt_cache: Optional[Tuple[str, str]] = None
+        # Items visible at _visible_level, in order and by key
+        self._visible_level: Optional[int] = None
+        self._visible: List[MenuItem] = []
+        self._visible_by_key: Dict[str, MenuItem] = {}
+        self._width: Optional[int] = None
 
     def add_item(
         self,
@@ -38,83 +101,187 @@ class Menu:
         handler: Optional[Callable] = None,
         min_access: int = 0,
         submenu: Optional["Menu"] = None,
+        exit_menu: bool = False,
     ) -> None:
-        self.items.append(MenuItem(key, label, handler, min_access, submenu))
+        self.items.append(MenuItem(key, label, handler, min_access, submenu, exit_menu))
+        self._frame_cache.clear()
+        self._visible_level = None
+        self._width = None
+
+    def _frame_width(self) -> int:
+        """Inner box width, cached until items change"""
+        if self._width is None:
+            # len(f"[{key}] {label}") + 2 padding, without building the strings
+            self._width = max(len(self.title), max(len(i.key) + len(i.label) + 5 for i in self.items))
+        return self._width
+
+    def _refresh_visible(self) -> None:
+        """Rebuild the visible item list/lookup if items or access level changed"""
+        access_level = self.session.access_level
+        if self._visible_level == access_level:
+            return
+
+        self._visible = [item for item in self.items if access_level >= item.min_access]
+        self._visible_by_key = {}
+        for item in self._visible:
+            self._visible_by_key.setdefault(item.key, item)
+        self._visible_level = access_level
 
     async def display(self) -> None:
-        await self.session.clear_screen()
-
+        caps = self.session.capabilities
+        key = (
+            caps.ansi, caps.color, caps.rows, caps.encoding, caps.seven_bit,
+            self.session.access_level, self.session.language, self.title,
+        )
+        frame = self._frame_cache.get(key)
+        if frame is not None:
+            self._frame_cache.move_to_end(key)
+        else:
+            self._refresh_visible()
+            # The choice prompt rides along, so a redraw is one cached write
+            text = self._render_frame() + self._choice_prompt()
+            # Encode once, the same way SessionIO.write() would for text
+            if caps.seven_bit:
+                text = transliterate(text)
+            frame = text.encode(caps.encoding, errors='replace')
+
+            self._frame_cache[key] = frame
+            # Evict the least recently drawn frame, not the whole cache
+            if len(self._frame_cache) > self._frame_cache_max:
+                self._frame_cache.popitem(last=False)
+
+        await self.session.write(frame)
+
+    def _render_frame(self) -> str:
+        """Build the full menu frame (clear screen, borders, items, colors) as one string"""
+        # Same output as clear_screen(), so the redraw is a single write
         if self.session.capabilities.ansi:
-            await self.session.set_color(fg=3, bold=True)
-            width = max(len(self.title), max(len(f"[{i.key}] {i.label}") for i in self.items) + 2)
-            await self.session.writeline("╔" + "═" * width + "╗")
-            await self.session.writeline("║ " + self.title.center(width - 2) + " ║")
-            await self.session.writeline("╟" + "─" * width + "╢")
-
-            await self.session.reset_color()
-
-            for item in self.items:
-                if self.session.access_level >= item.min_access:
-                    await self.session.set_color(fg=6)
-                    await self.session.write(f"║ [{item.key}] ")
-                    await self.session.set_color(fg=7)
-                    await self.session.write(f"{item.label}".ljust(width - len(item.key) - 5))
-                    await self.session.writeline(" ║")
-
-            await self.session.set_color(fg=3, bold=True)
-            await self.session.writeline("╚" + "═" * width + "╝")
-            await self.session.reset_color()
-
+            clear = "\x1b[2J\x1b[H"
         else:
-            await self.session.writeline("=" * 40)
-            await self.session.writeline(self.title.center(40))
-            await self.session.writeline("-" * 40)
+            clear = "\r\n" * self.session.capabilities.rows
 
-            for item in self.items:
-                if self.session.access_level >= item.min_access:
-                    await self.session.writeline(f"  [{item.key}] {item.label}")
+        lines = []
 
-            await self.session.writeline("=" * 40)
+        if self.session.capabilities.ansi:
+            if self.session.capabilities.color:
+                title_color, key_color, label_color = _SGR_YELLOW_BOLD, _SGR_CYAN, _SGR_WHITE
+            else:
+                title_color = key_color = label_color = ""
+            reset = _SGR_RESET
 
-        await self.session.writeline()
+            width = self._frame_width()
+            hbar = "═" * width
+            lines.append(title_color + "╔" + hbar + "╗")
+            lines.append("║ " + self.title.center(width - 2) + " ║")
+            lines.append("╟" + "─" * width + "╢" + reset)
 
-    async def get_choice(self) -> Optional[MenuItem]:
-        prompt = f"{self.session.t('login.your_choice')}: "
-        choice = (await self.session.readline(prompt)).upper()
+            # Room left for "[key] label" after "[", "] " and the 2 padding columns
+            label_width = width - 5
+            for item in self._visible:
+                lines.append(
+                    f"{key_color}║ [{item.key}] "
+                    f"{label_color}{item.label.ljust(label_width - len(item.key))} ║"
+                )
 
-        for item in self.items:
-            if item.key == choice and self.session.access_level >= item.min_access:
-                return item
+            lines.append(title_color + "╚" + hbar + "╝" + reset)
 
-        return None
+        else:
+            lines.append(_SEP_EQ)
+            lines.append(self.title.center(40))
+            lines.append(_SEP_DASH)
+
+            for item in self._visible:
+                lines.append(f"  [{item.key}] {item.label}")
+
+            lines.append(_SEP_EQ)
+
+        lines.append("")
+        return clear + "\r\n".join(lines) + "\r\n"
+
+    def _choice_prompt(self) -> str:
+        """Get the translated choice prompt, resolved once per language"""
+        language = self.session.language
+        if self._prompt_cache is None or self._prompt_cache[0] != language:
+            self._prompt_cache = (language, f"{self.session.t('login.your_choice')}: ")
+        return self._prompt_cache[1]
+
+    async def get_choice(self, prompt: bool = True) -> Optional[MenuItem]:
+        """Read a menu key; pass prompt=False right after display(), which already sent it"""
+        choice = (await self.session.readline(self._choice_prompt() if prompt else "")).upper()
+
+        self._refresh_visible()
+        return self._visible_by_key.get(choice)
+
+    async def _press_any_key(self, prompt: Optional[str] = None) -> None:
+        """Wait for a keypress; raises ConnectionClosedError if the session disconnects first"""
+        if prompt is not None:
+            await self.session.writeline(prompt)
+
+        read = asyncio.create_task(self.session.read(1))
+        closed = asyncio.create_task(self.session.disconnect_event.wait())
+        try:
+            await asyncio.wait({read, closed}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            read.cancel()
+            closed.cancel()
+
+        if read.done() and not read.cancelled():
+            # Re-raise read errors such as ConnectionClosedError
+            read.result()
+        else:
+            # Unwind the handler chain to the connection handler
+            raise ConnectionClosedError("Session disconnected")
 
     async def run(self) -> None:
-        while self.running:
-            await self.display()
-            item = await self.get_choice()
+        redraw = True
+        # A disconnected session reads "" without waiting, so stop on disconnect
+        while self.running and not self.session.disconnect_event.is_set():
+            if redraw:
+                await self.display()
+            item = await self.get_choice(prompt=not redraw)
+            redraw = True
 
             if item:
-                if item.submenu:
+                if item.exit_menu:
+                    self.running = False
+                elif item.submenu:
                     await item.submenu.run()
                 elif item.handler:
                     try:
                         result = item.handler()
-                        if inspect.iscoroutine(result):
+                        if asyncio.iscoroutine(result):
                             await result
+                    except ConnectionClosedError:
+                        raise
                     except Exception as e:
                         logger.error(f"Menu handler error: {e}", exc_info=True)
                         await self.session.writeline(f"\r\nError: {e}")
-                        await self.session.writeline("Press any key to continue...")
-                        await self.session.read(1)
+                        await self._press_any_key(_PRESS_ANY)
             else:
+                if self.session.disconnect_event.is_set():
+                    break
+                # Re-prompt in place, the menu is still on screen
                 await self.session.writeline("Invalid selection. Please try again.")
-                await asyncio.sleep(1)
+                redraw = False
 
 
 class MainMenu(Menu):
+    # Rendered frames shared by every MainMenu with the same labels, keyed by
+    # (language, seven_bit); each value is used as the instance's _frame_cache
+    _shared_frames: Dict[Tuple[str, bool], "OrderedDict[tuple, bytes]"] = {}
+
     def __init__(self, session: Session):
         super().__init__(session, session.t('menu.main_title'))
+        self.user_repo = UserRepository()
+        self.sys_repo = SystemRepository()
         self.setup_menu()
+        # Items are fixed from here on, so frames can be shared across sessions
+        labels_key = (session.language, session.capabilities.seven_bit)
+        self._frame_cache = MainMenu._shared_frames.setdefault(labels_key, OrderedDict())
+        self._frame_cache_max = _SHARED_FRAME_CACHE_MAX
+        # Personal settings submenu, built on first use for the current language
+        self._settings_menu: Optional[Menu] = None
+        self._settings_menu_lang: Optional[str] = None
 
     def setup_menu(self) -> None:
         self.add_item("M", self.session.t('menu.boards'), self.message_boards)
@@ -132,81 +299,93 @@ class MainMenu(Menu):
         self.add_item("Q", self.session.t('menu.quit'), self.quit)
 
     async def message_boards(self) -> None:
-        from .boards import BoardsUI
-        boards_ui = BoardsUI(self.session)
-        await boards_ui.run()
+        await _boards.BoardsUI(self.session).run()
 
     async def private_mail(self) -> None:
-        from .mail import MailUI
-        mail_ui = MailUI(self.session)
-        await mail_ui.run()
+        await _mail.MailUI(self.session).run()
 
     async def chat_rooms(self) -> None:
-        from .chat import ChatUI
-        chat_ui = ChatUI(self.session)
-        await chat_ui.run()
+        await _chat.ChatUI(self.session).run()
 
     async def file_library(self) -> None:
-        from .file_browser import FileBrowser
-        browser = FileBrowser(self.session)
-        await browser.run()
+        await _file_browser.FileBrowser(self.session).run()
 
     async def user_list(self) -> None:
-        await self.session.clear_screen()
-        await self.session.writeline(f"=== {self.session.t('users.title')} ===")
-        await self.session.writeline()
-
-        from ..storage.repositories import UserRepository
-        user_repo = UserRepository()
-        users = await user_repo.get_active_users(limit=50)
+        # Start the query first so it runs while the header is sent
+        fetch = asyncio.create_task(self.user_repo.get_active_users_summary(limit=50))
+        try:
+            await self.session.clear_screen()
+            await self.session.write(f"=== {self.session.t('users.title')} ===\r\n\r\n")
+        except BaseException:
+            fetch.cancel()
+            raise
+        users = await fetch
 
         if users:
             username_hdr = self.session.t('users.username')
             last_login_hdr = self.session.t('users.last_login')
             location_hdr = self.session.t('users.location')
-            await self.session.writeline(f"{username_hdr:<20} {last_login_hdr:<20} {location_hdr:<20}")
-            await self.session.writeline("-" * 60)
-
-            for user in users:
-                last_login = user.last_login_at.strftime("%Y-%m-%d %H:%M") if user.last_login_at else self.session.t('users.never')
-                location = user.location[:18] if user.location else self.session.t('users.unknown')
-                await self.session.writeline(f"{user.username:<20} {last_login:<20} {location:<20}")
+            never = self.session.t('users.never')
+            unknown = self.session.t('users.unknown')
+
+            lines = [_USER_ROW(username_hdr, last_login_hdr, location_hdr), "-" * 60]
+            lines.extend(
+                _USER_ROW(
+                    username,
+                    format_minute(last_login_at) if last_login_at else never,
+                    location[:18] if location else unknown,
+                )
+                for username, last_login_at, location in users
+            )
         else:
-            await self.session.writeline(self.session.t('users.no_users'))
-
-        await self.session.writeline()
-        await self.session.writeline(self.session.t('common.continue'))
-        await self.session.read(1)
+            lines = [self.session.t('users.no_users')]
 
-    async def system_stats(self) -> None:
-        await self.session.clear_screen()
-        await self.session.writeline(f"=== {self.session.t('admin.system_stats')} ===")
-        await self.session.writeline()
+        lines.append("")
+        lines.append(self.session.t('common.continue'))
 
-        from ..storage.repositories import SystemRepository
-        sys_repo = SystemRepository()
-        stats = await sys_repo.get_stats()
-
-        await self.session.writeline(self.session.t('admin.total_users', count=stats.get('total_users', 0)))
-        await self.session.writeline(self.session.t('admin.active_sessions', count=stats.get('active_sessions', 0)))
-        await self.session.writeline(self.session.t('admin.total_posts', count=stats.get('total_posts', 0)))
-        await self.session.writeline(self.session.t('admin.total_files', count=stats.get('total_files', 0)))
-        await self.session.writeline(self.session.t('admin.total_downloads', count=stats.get('total_downloads', 0)))
-        await self.session.writeline()
-        await self.session.writeline(self.session.t('admin.uptime', time=stats.get('uptime', '?')))
-        await self.session.writeline(self.session.t('admin.version', version=stats.get('version', '0.1.0')))
+        # Send the whole table in one write
+        await self.session.write("\r\n".join(lines) + "\r\n")
+        await self._press_any_key()
 
-        await self.session.writeline()
-        await self.session.writeline(self.session.t('common.continue'))
-        await self.session.read(1)
+    async def system_stats(self) -> None:
+        # Start the query first so it runs while the header is sent
+        fetch = asyncio.create_task(self.sys_repo.get_stats())
+        try:
+            await self.session.clear_screen()
+            await self.session.write(f"=== {self.session.t('admin.system_stats')} ===\r\n\r\n")
+        except BaseException:
+            fetch.cancel()
+            raise
+        stats = await fetch
+
+        lines = [
+            self.session.t('admin.total_users', count=stats.get('total_users', 0)),
+            self.session.t('admin.active_sessions', count=stats.get('active_sessions', 0)),
+            self.session.t('admin.total_posts', count=stats.get('total_posts', 0)),
+            self.session.t('admin.total_files', count=stats.get('total_files', 0)),
+            self.session.t('admin.total_downloads', count=stats.get('total_downloads', 0)),
+            "",
+            self.session.t('admin.uptime', time=stats.get('uptime', '?')),
+            self.session.t('admin.version', version=stats.get('version', '0.1.0')),
+            "",
+            self.session.t('common.continue'),
+        ]
+        await self.session.write("\r\n".join(lines) + "\r\n")
+        await self._press_any_key()
 
     async def personal_settings(self) -> None:
-        settings_menu = Menu(self.session, self.session.t('settings.title'))
-        settings_menu.add_item("1", self.session.t('settings.change_password'), self.change_password)
-        settings_menu.add_item("2", self.session.t('settings.change_email'), self.change_email)
-        settings_menu.add_item("3", self.session.t('settings.view_profile'), self.view_profile)
-        settings_menu.add_item("Q", self.session.t('common.back'), lambda: setattr(settings_menu, "running", False))
-
+        settings_menu = self._settings_menu
+        if settings_menu is None or self._settings_menu_lang != self.session.language:
+            settings_menu = Menu(self.session, self.session.t('settings.title'))
+            settings_menu.add_item("1", self.session.t('settings.change_password'), self.change_password)
+            settings_menu.add_item("2", self.session.t('settings.change_email'), self.change_email)
+            settings_menu.add_item("3", self.session.t('settings.view_profile'), self.view_profile)
+            settings_menu.add_item("Q", self.session.t('common.back'), exit_menu=True)
+            self._settings_menu = settings_menu
+            self._settings_menu_lang = self.session.language
+
+        # Back leaves running False, reset it for this visit
+        settings_menu.running = True
         await settings_menu.run()
 
     async def change_password(self) -> None:
@@ -225,8 +404,7 @@ class MainMenu(Menu):
         else:
             await self.session.writeline("\r\nPassword changed successfully!")
 
-        await self.session.writeline("\r\nPress any key to continue...")
-        await self.session.read(1)
+        await self._press_any_key("\r\n" + _PRESS_ANY)
 
     async def change_email(self) -> None:
         await self.session.clear_screen()
@@ -240,52 +418,55 @@ class MainMenu(Menu):
         else:
             await self.session.writeline("\r\nEmail not changed.")
 
-        await self.session.writeline("\r\nPress any key to continue...")
-        await self.session.read(1)
+        await self._press_any_key("\r\n" + _PRESS_ANY)
 
     async def view_profile(self) -> None:
         await self.session.clear_screen()
-        await self.session.writeline("=== Your Profile ===")
-        await self.session.writeline()
-        await self.session.writeline(f"Username:      {self.session.username}")
-        await self.session.writeline(f"Access Level:  {self.session.access_level}")
-        await self.session.writeline(f"Session ID:    {self.session.id}")
-        await self.session.writeline(f"Connected At:  {self.session.connected_at.strftime('%Y-%m-%d %H:%M:%S')}")
-
-        await self.session.writeline()
-        await self.session.writeline("Press any key to continue...")
-        await self.session.read(1)
+        # Send the whole profile screen in one write
+        await self.session.write(
+            "=== Your Profile ===\r\n"
+            "\r\n"
+            f"Username:      {self.session.username}\r\n"
+            f"Access Level:  {self.session.access_level}\r\n"
+            f"Session ID:    {self.session.id}\r\n"
+            f"Connected At:  {self.session.connected_at.strftime('%Y-%m-%d %H:%M:%S')}\r\n"
+            "\r\n"
+        )
+        await self._press_any_key(_PRESS_ANY)
 
     async def admin_menu(self) -> None:
-        from .admin import AdminUI
-        admin_ui = AdminUI(self.session)
-        await admin_ui.run()
+        await _admin.AdminUI(self.session).run()
 
     async def show_help(self) -> None:
         await self.session.clear_screen()
-        await self.session.writeline(self.session.t('help.title'))
-        await self.session.writeline()
-        await self.session.writeline(self.session.t('help.navigation'))
-        await self.session.writeline(f"  - {self.session.t('help.nav_text')}")
-        await self.session.writeline(f"  - {self.session.t('help.nav_enter')}")
-        await self.session.writeline()
-        await self.session.writeline(self.session.t('help.features'))
-        await self.session.writeline(f"  - {self.session.t('help.feat_boards')}")
-        await self.session.writeline(f"  - {self.session.t('help.feat_mail')}")
-        await self.session.writeline(f"  - {self.session.t('help.feat_chat')}")
-        await self.session.writeline(f"  - {self.session.t('help.feat_files')}")
-        await self.session.writeline()
-        await self.session.writeline(self.session.t('help.commands'))
-        await self.session.writeline(f"  - {self.session.t('help.cmd_interrupt')}")
-        await self.session.writeline(f"  - {self.session.t('help.cmd_pause')}")
-
-        await self.session.writeline()
-        await self.session.writeline(self.session.t('common.continue'))
-        await self.session.read(1)
+        await self.session.write(self._help_text())
+        await self._press_any_key()
+
+    def _help_text(self) -> str:
+        """Translated help screen, joined once per language"""
+        cache_key = (self.session.language, self.session.capabilities.seven_bit)
+        text = _help_cache.get(cache_key)
+        if text is None:
+            text = "\r\n".join(
+                f"{prefix}{self.session.t(key)}" if key else ""
+                for prefix, key in _HELP_LINES
+            ) + "\r\n"
+            _help_cache[cache_key] = text
+        return text
 
     async def quit(self) -> None:
-        await self.session.writeline()
-        await self.session.writeline(self.session.t('common.thank_you'))
-        await self.session.writeline(self.session.t('common.goodbye'))
-        await asyncio.sleep(1)
-        self.running = False
\ No newline at end of file
+        # write() drains the transport, so the goodbye is on the wire before
+        # the connection closes; no grace delay needed
+        await self.session.write(
+            f"\r\n{self.session.t('common.thank_you')}\r\n{self.session.t('common.goodbye')}\r\n"
+        )
+        self.running = False
+
+
+# Feature UIs import Menu from this module, so bind them as modules after
+# Menu is defined; handlers resolve the class attribute at call time.
+from . import admin as _admin  # noqa: E402
+from . import boards as _boards  # noqa: E402
+from . import chat as _chat  # noqa: E402
+from . import file_browser as _file_browser  # noqa: E402
+from . import mail as _mail  # noqa: E402
@@ -1,8 +1,9 @@
+import logging
 import os
+import tomllib
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import toml
 from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
@@ -174,6 +175,15 @@ class LoggingConfig(BaseModel):
     backup_count: int = 5
     enable_syslog: bool = False
 
+    @field_validator('level')
+    @classmethod
+    def validate_level(cls, v: str) -> str:
+        # Normalized once here so setup_logging can pass it straight to setLevel()
+        level = v.upper()
+        if level not in logging.getLevelNamesMapping():
+            raise ConfigurationError(f"Unknown log level: {v}")
+        return level
+
 
 class RipscripConfig(BaseModel):
     enable: bool = True
@@ -208,8 +218,8 @@ class Config(BaseSettings):
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(path, "r") as f:
-            data = toml.load(f)
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
 
         return cls(**data)
 
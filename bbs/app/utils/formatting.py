@@ -0,0 +1,8 @@
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def format_minute(dt: datetime) -> str:
+    """Format a timestamp to the minute (cached, listings cluster by minute)"""
+    return dt.strftime("%Y-%m-%d %H:%M")
@@ -1,25 +1,71 @@
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from .config import get_config
 
 
+# Loggers already configured by setup_logging(), by name
+_configured: Dict[str, logging.Logger] = {}
+
+# Background listeners that run the real handlers, one per configured logger
+_listeners: List[QueueListener] = []
+
+
+# LogRecord fields filled on every record unless disabled: (module flag, format names)
+_OPTIONAL_RECORD_FIELDS = (
+    ("logThreads", ("thread", "threadName")),
+    ("logProcesses", ("process",)),
+    ("logMultiprocessing", ("processName",)),
+    ("logAsyncioTasks", ("taskName",)),
+)
+
+
+def _skip_unused_record_fields(fmt: str) -> None:
+    """
+    Stop LogRecord from collecting thread/process/task info the format never prints.
+
+    The logging.log* flags are process-wide, so this affects every logger,
+    third-party ones included. Nothing in the BBS configures another
+    formatter; none of the shipped config formats use these fields.
+    """
+    for flag, names in _OPTIONAL_RECORD_FIELDS:
+        if hasattr(logging, flag) and not any(f"%({n})" in fmt for n in names):
+            setattr(logging, flag, False)
+
+
 def setup_logging(name: str = "bbs") -> logging.Logger:
+    """
+    Configure the BBS logger once per process and return it.
+
+    Side effect: thread, process and asyncio task fields that logging.format
+    doesn't reference are switched off for the whole process (see
+    _skip_unused_record_fields), so a handler added elsewhere whose format
+    uses %(thread)d, %(process)d, %(processName)s or %(taskName)s sees None.
+    Put such fields in logging.format to keep them.
+    """
+    logger = _configured.get(name)
+    if logger is not None:
+        return logger
+
     config = get_config()
     log_config = config.logging
 
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_config.level))
+    logger.setLevel(log_config.level)
     logger.handlers.clear()
 
+    # One formatter shared by all handlers
     formatter = logging.Formatter(log_config.format)
+    _skip_unused_record_fields(log_config.format)
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
 
     if log_config.file_path:
         log_path = Path(log_config.file_path)
@@ -31,10 +77,34 @@ def setup_logging(name: str = "bbs") -> logging.Logger:
             backupCount=log_config.backup_count,
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
+    # The event loop only enqueues records; console/file I/O happens on the
+    # listener's thread
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    if not _listeners:
+        atexit.register(stop_logging)
+    _listeners.append(listener)
+
+    _configured[name] = logger
     return logger
 
 
+def stop_logging() -> None:
+    """Flush queued records and stop the listener threads"""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+# get_logger() results by short name, avoids the logging module lock on repeat calls
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+
 def get_logger(name: str) -> logging.Logger:
-    return logging.getLogger(f"bbs.{name}")
\ No newline at end of file
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = _LOGGERS[name] = logging.getLogger(f"bbs.{name}")
+    return logger
@@ -7,6 +7,7 @@ Seed the database with demo data for testing and development
 import asyncio
 import sys
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -20,61 +21,109 @@ from bbs.app.utils.logger import setup_logging
 logger = setup_logging()
 
 
-async def seed_data():
-    """Seed the database with demo data"""
-    logger.info("Initializing database...")
-    await init_database()
-    await create_tables()
-
-    auth = AuthManager()
-    user_repo = UserRepository()
-    board_repo = BoardRepository()
-    chat_repo = ChatRepository()
-
-    # Create demo users
+class DemoUser(NamedTuple):
+    username: str
+    password: str
+    email: Optional[str]
+    access_level: int
+    real_name: str
+
+
+class DemoBoard(NamedTuple):
+    name: str
+    description: str
+    min_read: int
+    min_write: int
+
+
+class DemoPost(NamedTuple):
+    board: str
+    author: str
+    subject: str
+    body: str
+
+
+class DemoRoom(NamedTuple):
+    name: str
+    description: str
+    min_access: int
+    is_private: bool
+
+
+DEMO_USERS = (
+    DemoUser("sysop", "admin123", "sysop@bbs.local", 100, "System Operator"),
+    DemoUser("john", "password", "john@example.com", 1, "John Doe"),
+    DemoUser("jane", "password", "jane@example.com", 5, "Jane Smith"),
+    DemoUser("moderator", "modpass", "mod@bbs.local", 10, "Moderator"),
+    DemoUser("guest", "guest", None, 0, "Guest User"),
+)
+
+DEMO_BOARDS = (
+    DemoBoard("general", "General Discussion", 0, 1),
+    DemoBoard("tech", "Technology & Computing", 0, 1),
+    DemoBoard("games", "Gaming Discussion", 0, 1),
+    DemoBoard("marketplace", "Buy, Sell, Trade", 1, 1),
+    DemoBoard("admin", "Administration", 10, 10),
+)
+
+DEMO_POSTS = (
+    DemoPost("general", "sysop", "Welcome to Perestroika BBS!", "Welcome everyone to our new BBS system!"),
+    DemoPost("general", "john", "Hello World", "Just saying hi to everyone!"),
+    DemoPost("tech", "jane", "Python vs Ruby", "What do you think is better for web development?"),
+    DemoPost("games", "john", "Favorite retro games?", "What are your favorite games from the 80s and 90s?"),
+)
+
+DEMO_ROOMS = (
+    DemoRoom("main", "Main Lobby", 0, False),
+    DemoRoom("tech", "Tech Talk", 0, False),
+    DemoRoom("random", "Random Chat", 0, False),
+    DemoRoom("moderators", "Moderator Room", 10, True),
+)
+
+
+async def _seed_users(auth: AuthManager, user_repo: UserRepository) -> dict:
+    """Create missing demo users; returns username -> User"""
     logger.info("Creating demo users...")
 
-    users = [
-        ("sysop", "admin123", "sysop@bbs.local", 100, "System Operator"),
-        ("john", "password", "john@example.com", 1, "John Doe"),
-        ("jane", "password", "jane@example.com", 5, "Jane Smith"),
-        ("moderator", "modpass", "mod@bbs.local", 10, "Moderator"),
-        ("guest", "guest", None, 0, "Guest User"),
-    ]
+    # One query for all existing users instead of one per name
+    existing_users = await user_repo.get_by_usernames(u.username for u in DEMO_USERS)
+
+    # Hash passwords for the missing users concurrently (argon2 runs in threads)
+    missing = [u for u in DEMO_USERS if u.username not in existing_users]
+    hashes = await asyncio.gather(*(auth.hash_password(u.password) for u in missing))
+    password_hashes = {u.username: h for u, h in zip(missing, hashes)}
 
     created_users = {}
-    for username, password, email, access_level, real_name in users:
-        existing = await user_repo.get_by_username(username)
+    for username, _, email, access_level, real_name in DEMO_USERS:
+        existing = existing_users.get(username)
         if not existing:
-            password_hash = await auth.hash_password(password)
+            password_hash = password_hashes[username]
             user = await user_repo.create(
                 username=username,
                 password_hash=password_hash,
                 email=email,
                 real_name=real_name,
+                access_level=access_level,
             )
             if user:
-                await user_repo.update_access_level(user.id, access_level)
                 created_users[username] = user
                 logger.info(f"  Created user: {username} (access: {access_level})")
         else:
             created_users[username] = existing
             logger.info(f"  User exists: {username}")
 
-    # Create demo boards
+    return created_users
+
+
+async def _seed_boards(board_repo: BoardRepository) -> dict:
+    """Create missing demo boards; returns name -> Board"""
     logger.info("Creating demo boards...")
 
-    boards_data = [
-        ("general", "General Discussion", 0, 1),
-        ("tech", "Technology & Computing", 0, 1),
-        ("games", "Gaming Discussion", 0, 1),
-        ("marketplace", "Buy, Sell, Trade", 1, 1),
-        ("admin", "Administration", 10, 10),
-    ]
+    existing_boards = await board_repo.get_boards_by_names(b.name for b in DEMO_BOARDS)
 
     created_boards = {}
-    for name, description, min_read, min_write in boards_data:
-        existing = await board_repo.get_board_by_name(name)
+    for name, description, min_read, min_write in DEMO_BOARDS:
+        existing = existing_boards.get(name)
         if not existing:
             board = await board_repo.create_board(
                 name=name,
@@ -88,42 +137,37 @@ async def seed_data():
             created_boards[name] = existing
             logger.info(f"  Board exists: {name}")
 
-    # Create demo posts
+    return created_boards
+
+
+async def _seed_posts(board_repo: BoardRepository, created_users: dict, created_boards: dict) -> None:
+    """Create demo posts; needs both users and boards in place"""
     logger.info("Creating demo posts...")
 
-    if created_boards and created_users:
-        posts_data = [
-            ("general", "sysop", "Welcome to Perestroika BBS!", "Welcome everyone to our new BBS system!"),
-            ("general", "john", "Hello World", "Just saying hi to everyone!"),
-            ("tech", "jane", "Python vs Ruby", "What do you think is better for web development?"),
-            ("games", "john", "Favorite retro games?", "What are your favorite games from the 80s and 90s?"),
-        ]
-
-        for board_name, author_name, subject, body in posts_data:
-            board = created_boards.get(board_name)
-            user = created_users.get(author_name)
-
-            if board and user:
-                post = await board_repo.create_post(
-                    board_id=board.id,
-                    author_id=user.id,
-                    subject=subject,
-                    body=body,
-                )
-                logger.info(f"  Created post: '{subject}' in {board_name}")
-
-    # Create chat rooms
+    if not (created_boards and created_users):
+        return
+
+    # Resolve ids first, then insert every post in one transaction
+    post_rows = []
+    for post in DEMO_POSTS:
+        board = created_boards.get(post.board)
+        user = created_users.get(post.author)
+
+        if board and user:
+            post_rows.append((board.id, user.id, post.subject, post.body))
+
+    created = await board_repo.create_posts_bulk(post_rows)
+    logger.info(f"  Created {created} of {len(DEMO_POSTS)} posts")
+
+
+async def _seed_rooms(chat_repo: ChatRepository) -> None:
+    """Create missing chat rooms"""
     logger.info("Creating chat rooms...")
 
-    rooms_data = [
-        ("main", "Main Lobby", 0, False),
-        ("tech", "Tech Talk", 0, False),
-        ("random", "Random Chat", 0, False),
-        ("moderators", "Moderator Room", 10, True),
-    ]
+    existing_rooms = await chat_repo.get_rooms_by_names(r.name for r in DEMO_ROOMS)
 
-    for name, description, min_access, is_private in rooms_data:
-        existing = await chat_repo.get_room_by_name(name)
+    for name, description, min_access, is_private in DEMO_ROOMS:
+        existing = existing_rooms.get(name)
         if not existing:
             room = await chat_repo.create_room(
                 name=name,
@@ -135,6 +179,29 @@ async def seed_data():
         else:
             logger.info(f"  Chat room exists: {name}")
 
+
+async def seed_data():
+    """Seed the database with demo data"""
+    logger.info("Initializing database...")
+    await init_database()
+    await create_tables()
+
+    auth = AuthManager()
+    user_repo = UserRepository()
+    board_repo = BoardRepository()
+    chat_repo = ChatRepository()
+
+    # Users, boards and rooms are independent; each repository call uses its
+    # own pooled session, so the stages can run side by side
+    created_users, created_boards, _ = await asyncio.gather(
+        _seed_users(auth, user_repo),
+        _seed_boards(board_repo),
+        _seed_rooms(chat_repo),
+    )
+
+    # Posts reference both users and boards
+    await _seed_posts(board_repo, created_users, created_boards)
+
     logger.info("Demo data seeding completed!")
     logger.info("")
     logger.info("Demo user credentials:")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Test Cyrillic charset support (CP866, MacCyrillic)"""
+
+import asyncio
+import codecs
+import io
+from functools import partial
+
+# (charset menu position, codec name)
+# Menu: 1 UTF-8, 2 CP437, 3 CP866, 4 ISO-8859-1, 5 ISO-8859-2, 6 ISO-8859-5,
+# 7 ISO-8859-7, 8 KOI8-R, 9 Windows-1251, 10 Windows-1252, 11 MacRoman,
+# 12 MacCyrillic, 13 Shift_JIS
+CHARSETS = [
+    (3, 'cp866'),
+    (12, 'x-mac-cyrillic'),
+]
+
+
+def _lookup_decoder(codec):
+    """Resolve the codec once; None if this Python build lacks it"""
+    try:
+        return codecs.lookup(codec).decode
+    except LookupError:
+        return None
+
+
+# Resolve every codec once instead of a registry lookup per decode
+_DECODERS = {codec: _lookup_decoder(codec) for _, codec in CHARSETS}
+
+
+async def read_available(reader, idle=0.5):
+    """Read until the server goes quiet for `idle` seconds (or EOF)"""
+    response = bytearray()
+    while True:
+        try:
+            data = await asyncio.wait_for(reader.read(1024), timeout=idle)
+        except asyncio.TimeoutError:
+            break
+        if not data:
+            break
+        response.extend(data)
+    return response
+
+
+async def test_charset(menu_idx, codec):
+    """Select charset `menu_idx` and decode the reply with `codec`"""
+    # Tests run concurrently, so buffer the report and print it as one block
+    out = io.StringIO()
+    log = partial(print, file=out)
+
+    log(f"\nTesting {codec} charset support (menu option #{menu_idx})...")
+
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection('localhost', 2323), timeout=5
+        )
+    except Exception as e:
+        log(f"\n✗ Error testing {codec}: {e}")
+        return False, out.getvalue()
+
+    try:
+        # Read the welcome/charset screen
+        initial = await read_available(reader, idle=1.5)
+        log(f"Initial connection: {len(initial)} bytes")
+
+        writer.write(f"{menu_idx}\r\n".encode())
+        await writer.drain()
+
+        response = await read_available(reader)
+
+        if response:
+            decode = _DECODERS[codec]
+            if decode is None:
+                log(f"⚠ Python doesn't support {codec} codec on this system")
+                log("  (This is OK - the BBS will handle it)")
+            else:
+                try:
+                    decoded, _ = decode(response, 'replace')
+                    log(f"✓ {codec} encoding selected successfully")
+                    log(f"Response includes terminal config prompt: {'Terminal' in decoded or 'terminal' in decoded}")
+
+                    # Check for Russian text if present
+                    if 'Русский' in decoded or 'русский' in decoded:
+                        log(f"✓ Russian text detected in {codec} encoding")
+
+                    # Charsets without box drawing fall back to ASCII
+                    if '+' in decoded or '-' in decoded or '|' in decoded:
+                        log("✓ ASCII box drawing detected")
+
+                except Exception as e:
+                    log(f"✗ Failed to decode as {codec}: {e}")
+
+        log(f"\n✅ {codec} charset is available and working!")
+        return True, out.getvalue()
+
+    except Exception as e:
+        log(f"\n✗ Error testing {codec}: {e}")
+        return False, out.getvalue()
+
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def main():
+    """Test all charsets"""
+    # Each charset is its own connection, so run them side by side
+    results = await asyncio.gather(*[test_charset(*x) for x in CHARSETS])
+    for _, report in results:
+        print(report, end="")
+    return all(success for success, _ in results)
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    exit(0 if success else 1)
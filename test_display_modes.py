@@ -2,15 +2,46 @@
 """Test all 4 display modes of the BBS template system"""
 
 import asyncio
+import io
 import telnetlib3
 import sys
 import time
+from functools import partial
+
+# Every MOTD ends with a press-any-key line (common.continue at 80 columns,
+# common.continue_short otherwise), and the BBS then waits for a key before
+# sending the login menu; "Press a" is the prefix both English strings share
+MOTD_END = "Press a"
+
+
+async def read_until(reader, chunks, marker, timeout=3.0):
+    """Read into chunks until marker arrives (or timeout / EOF)"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    tail = ""
+    while marker not in tail:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return
+        try:
+            data = await asyncio.wait_for(reader.read(1024), timeout=remaining)
+        except asyncio.TimeoutError:
+            return
+        if not data:
+            return
+        chunks.append(data)
+        # Only the last len(marker) - 1 chars can start a match spanning chunks
+        tail = tail[-len(marker):] + data
 
 async def test_display_mode(mode_num: int, mode_name: str):
-    """Test a specific display mode"""
-    print(f"\n{'='*60}")
-    print(f"Testing Display Mode {mode_num}: {mode_name}")
-    print(f"{'='*60}")
+    """Test a specific display mode, returning its report text"""
+    # Tests run concurrently, so buffer the report and print it as one block
+    out = io.StringIO()
+    log = partial(print, file=out)
+
+    log(f"\n{'='*60}")
+    log(f"Testing Display Mode {mode_num}: {mode_name}")
+    log(f"{'='*60}")
 
     reader, writer = await telnetlib3.open_connection('localhost', 2323)
 
@@ -34,8 +65,9 @@ async def test_display_mode(mode_num: int, mode_name: str):
         await asyncio.sleep(0.5)
 
         # Capture MOTD output
-        print("\nCapturing MOTD output...")
-        await asyncio.sleep(2)
+        log("\nCapturing MOTD output...")
+        chunks = []
+        await read_until(reader, chunks, MOTD_END)
 
         # Press a key to continue past MOTD
         writer.write(" ")
@@ -48,67 +80,72 @@ async def test_display_mode(mode_num: int, mode_name: str):
         await asyncio.sleep(1)
 
         # Read accumulated output
-        output_buffer = ""
         while True:
             try:
                 data = await asyncio.wait_for(reader.read(1024), timeout=0.5)
                 if data:
-                    output_buffer += data
+                    chunks.append(data)
                 else:
                     break
             except asyncio.TimeoutError:
                 break
+        output_buffer = "".join(chunks)
+
+        # Scan for ANSI once, shared by every mode check
+        has_ansi = "\x1b[" in output_buffer
 
         # Check for expected patterns based on mode
         if mode_num == 1:  # 80x24 ANSI
-            if "\x1b[" in output_buffer and "═" in output_buffer:
-                print("✓ ANSI codes detected")
-                print("✓ Box drawing characters detected")
-                print("✓ 80-column layout confirmed")
+            if has_ansi and "═" in output_buffer:
+                log("✓ ANSI codes detected")
+                log("✓ Box drawing characters detected")
+                log("✓ 80-column layout confirmed")
             else:
-                print("✗ Missing expected ANSI/box drawing for 80x24 ANSI mode")
+                log("✗ Missing expected ANSI/box drawing for 80x24 ANSI mode")
 
         elif mode_num == 2:  # 80x24 Plain
-            if "\x1b[" not in output_buffer and "+" in output_buffer:
-                print("✓ No ANSI codes (plain text)")
-                print("✓ ASCII box characters detected")
-                print("✓ 80-column layout confirmed")
+            if not has_ansi and "+" in output_buffer:
+                log("✓ No ANSI codes (plain text)")
+                log("✓ ASCII box characters detected")
+                log("✓ 80-column layout confirmed")
             else:
-                print("✗ Unexpected formatting for 80x24 Plain mode")
+                log("✗ Unexpected formatting for 80x24 Plain mode")
 
         elif mode_num == 3:  # 40x24 ANSI
-            if "\x1b[" in output_buffer and "╔" in output_buffer:
-                print("✓ ANSI codes detected")
-                print("✓ Box drawing characters detected")
-                print("✓ 40-column narrow layout")
+            if has_ansi and "╔" in output_buffer:
+                log("✓ ANSI codes detected")
+                log("✓ Box drawing characters detected")
+                log("✓ 40-column narrow layout")
             else:
-                print("✗ Missing expected ANSI/box drawing for 40x24 ANSI mode")
+                log("✗ Missing expected ANSI/box drawing for 40x24 ANSI mode")
 
         elif mode_num == 4:  # 40x24 Plain
-            if "\x1b[" not in output_buffer and "+" in output_buffer:
-                print("✓ No ANSI codes (plain text)")
-                print("✓ ASCII box characters detected")
-                print("✓ 40-column narrow layout")
+            if not has_ansi and "+" in output_buffer:
+                log("✓ No ANSI codes (plain text)")
+                log("✓ ASCII box characters detected")
+                log("✓ 40-column narrow layout")
             else:
-                print("✗ Unexpected formatting for 40x24 Plain mode")
+                log("✗ Unexpected formatting for 40x24 Plain mode")
 
         # Show a sample of the output
-        print("\nSample output (first 500 chars):")
-        print("-" * 40)
+        log("\nSample output (first 500 chars):")
+        log("-" * 40)
         # Clean up control codes for display
         sample = output_buffer[:500].replace('\x1b', '\\x1b')
-        print(sample)
-        print("-" * 40)
+        log(sample)
+        log("-" * 40)
 
-        print(f"\n✓ Test completed for {mode_name}")
+        log(f"\n✓ Test completed for {mode_name}")
 
     except Exception as e:
-        print(f"✗ Error testing {mode_name}: {e}")
+        log(f"✗ Error testing {mode_name}: {e}")
 
     finally:
         writer.close()
         await writer.wait_closed()
 
+    return out.getvalue()
+
 async def main():
     """Test all display modes"""
     print("BBS Template System - Display Mode Test")
@@ -125,9 +162,12 @@ async def main():
         (4, "40x24 plain text")
     ]
 
-    for mode_num, mode_name in modes:
-        await test_display_mode(mode_num, mode_name)
-        await asyncio.sleep(2)  # Wait between tests
+    # Each mode is its own telnet session, so run them side by side
+    reports = await asyncio.gather(
+        *(test_display_mode(mode_num, mode_name) for mode_num, mode_name in modes)
+    )
+    for report in reports:
+        print(report, end="")
 
     print("\n" + "="*60)
     print("All display mode tests completed!")
@@ -1,93 +1,102 @@
 #!/usr/bin/env python3
 """Test login and access to BBS features"""
-import socket
-import time
-import select
+import asyncio
+import re
+
+# One case-insensitive pass finds every feature keyword in the main menu
+FEATURE_RE = re.compile(r"(?P<boards>boards)|(?P<mail>mail)|(?P<chat>chat)|(?P<files>file)", re.I)
+FEATURE_LABELS = {
+    "boards": "Message Boards",
+    "mail": "Private Mail",
+    "chat": "Chat Rooms",
+    "files": "File Library",
+}
 
 class BBSTestClient:
-    def __init__(self, host="localhost", port=2323):
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sock.connect((host, port))
-        self.sock.setblocking(False)
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
 
-    def send(self, data):
+    @classmethod
+    async def connect(cls, host="localhost", port=2323):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def send(self, data):
         if isinstance(data, str):
             data = data.encode()
-        self.sock.send(data)
-
-    def receive(self, timeout=2.0):
-        """Receive data with timeout"""
-        data = b""
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            ready = select.select([self.sock], [], [], 0.1)
-            if ready[0]:
-                try:
-                    chunk = self.sock.recv(4096)
-                    if chunk:
-                        data += chunk
-                except BlockingIOError:
-                    pass
-        return data
-
-    def test_login_flow(self):
+        self.writer.write(data)
+        await self.writer.drain()
+
+    async def recv_until(self, needle, timeout=3.0):
+        """Receive until needle shows up in the data, or timeout"""
+        if isinstance(needle, str):
+            needle = needle.encode()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        data = bytearray()
+        while needle not in data:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                chunk = await asyncio.wait_for(self.reader.read(4096), remaining)
+            except asyncio.TimeoutError:
+                break
+            if not chunk:
+                break
+            data += chunk
+        return bytes(data)
+
+    async def test_login_flow(self):
         print("Testing BBS Login Flow...")
 
-        # Wait for initial prompt
-        time.sleep(1)
-        initial = self.receive(3)
+        # Wait for the charset prompt
+        initial = await self.recv_until(b"Choice [")
 
         # Select UTF-8
-        self.send(b"1\r\n")
-        time.sleep(0.5)
+        await self.send(b"1\r\n")
+        await self.recv_until(b"Selection [1]: ")
 
-        # Select English
-        self.send(b"1\r\n")
-        time.sleep(0.5)
+        # Standard ANSI display mode
+        await self.send(b"1\r\n")
+        await self.recv_until(b"Choice [")
 
-        # Skip terminal override
-        self.send(b"\r\n")
-        time.sleep(0.5)
+        # Default language
+        await self.send(b"\r\n")
 
         # Read welcome and menu
-        welcome = self.receive(3)
+        welcome = await self.recv_until(b"Your choice: ")
 
         # Try to login with demo credentials
         print("Attempting login with john/password...")
-        self.send(b"L\r\n")  # Login option
-        time.sleep(0.5)
+        await self.send(b"L\r\n")  # Login option
+        await self.recv_until(b"Username: ")
 
-        self.send(b"john\r\n")  # Username
-        time.sleep(0.5)
+        await self.send(b"john\r\n")  # Username
+        await self.recv_until(b"Password: ")
 
-        self.send(b"password\r\n")  # Password
-        time.sleep(1)
+        await self.send(b"password\r\n")  # Password
 
         # Check if we get the main menu
-        response = self.receive(3)
+        response = await self.recv_until(b"Your choice: ", timeout=5)
 
         # Check for features in response
         response_str = response.decode('utf-8', errors='ignore')
 
-        features_found = []
-        if "Message Boards" in response_str or "boards" in response_str.lower():
-            features_found.append("Message Boards")
-        if "Private Mail" in response_str or "mail" in response_str.lower():
-            features_found.append("Private Mail")
-        if "Chat" in response_str or "chat" in response_str.lower():
-            features_found.append("Chat Rooms")
-        if "File" in response_str or "file" in response_str.lower():
-            features_found.append("File Library")
+        found = {m.lastgroup for m in FEATURE_RE.finditer(response_str)}
+        features_found = [label for group, label in FEATURE_LABELS.items() if group in found]
 
         return features_found
 
-    def close(self):
-        self.sock.close()
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
 
-def main():
-    client = BBSTestClient()
+async def main():
+    client = await BBSTestClient.connect()
     try:
-        features = client.test_login_flow()
+        features = await client.test_login_flow()
 
         print("\n=== TEST RESULTS ===")
         if features:
@@ -99,7 +108,7 @@ def main():
             print("❌ Could not verify login or features")
 
     finally:
-        client.close()
+        await client.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -1,57 +1,57 @@
 #!/usr/bin/env python3
 """Debug BBS login flow"""
-import socket
-import time
-import select
+import asyncio
 
-def test_bbs_interactive():
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.connect(("localhost", 2323))
-    sock.setblocking(False)
+async def test_bbs_interactive():
+    reader, writer = await asyncio.open_connection("localhost", 2323)
+    loop = asyncio.get_running_loop()
 
-    def receive(timeout=2.0):
-        data = b""
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            ready = select.select([sock], [], [], 0.1)
-            if ready[0]:
-                try:
-                    chunk = sock.recv(4096)
-                    if chunk:
-                        data += chunk
-                except BlockingIOError:
-                    pass
-        return data
+    async def send(data):
+        writer.write(data)
+        await writer.drain()
+
+    async def receive_until(needle, timeout=3.0):
+        """Receive until needle shows up in the data, or timeout"""
+        deadline = loop.time() + timeout
+        data = bytearray()
+        while needle not in data:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                chunk = await asyncio.wait_for(reader.read(4096), remaining)
+            except asyncio.TimeoutError:
+                break
+            if not chunk:
+                break
+            data += chunk
+        return bytes(data)
 
     print("=== BBS INTERACTION DEBUG ===\n")
 
     # Stage 1: Initial connection
-    time.sleep(1)
-    data = receive(3)
+    data = await receive_until(b"Choice [")
     print("Stage 1 - Initial prompt:")
     print(data.decode('utf-8', errors='replace')[:500])
     print("-" * 40)
 
     # Stage 2: Select encoding (1 for UTF-8)
-    sock.send(b"1\r\n")
-    time.sleep(0.5)
-    data = receive(2)
+    await send(b"1\r\n")
+    data = await receive_until(b"Selection [1]: ")
     print("\nStage 2 - After encoding selection:")
     print(data.decode('utf-8', errors='replace')[:500])
     print("-" * 40)
 
     # Stage 3: Select language (1 for English)
-    sock.send(b"1\r\n")
-    time.sleep(0.5)
-    data = receive(2)
+    await send(b"1\r\n")
+    data = await receive_until(b"Choice [")
     print("\nStage 3 - After language selection:")
     print(data.decode('utf-8', errors='replace')[:500])
     print("-" * 40)
 
     # Stage 4: Terminal size (just enter to keep default)
-    sock.send(b"\r\n")
-    time.sleep(1)
-    data = receive(3)
+    await send(b"\r\n")
+    data = await receive_until(b"Your choice: ")
     print("\nStage 4 - After terminal size (MOTD and menu):")
     decoded = data.decode('utf-8', errors='replace')
     print(decoded[:800])
@@ -64,7 +64,8 @@ def test_bbs_interactive():
     if "[N]" in decoded or "Register" in decoded:
         print("✅ Found Register option")
 
-    sock.close()
+    writer.close()
+    await writer.wait_closed()
 
 if __name__ == "__main__":
-    test_bbs_interactive()
\ No newline at end of file
+    asyncio.run(test_bbs_interactive())
\ No newline at end of file
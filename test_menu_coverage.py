@@ -5,9 +5,13 @@ Tests all menu navigation paths to ensure 100% coverage
 """
 
 import asyncio
+import re
 import socket
 import time
 
+# BBS input prompts end in ": " (Your choice: , Choice [1-13]: , Username: )
+PROMPT_RE = re.compile(rb": ?$")
+
 class BBSMenuTester:
     def __init__(self):
         self.host = 'localhost'
@@ -17,29 +21,51 @@ class BBSMenuTester:
             'failed': [],
             'skipped': []
         }
+        # One connection shared by every test, opened in run_all_tests()
+        self.sock = None
 
     def connect(self):
         """Establish connection to BBS"""
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.connect((self.host, self.port))
+        # Wait for the charset prompt (at most 3s) rather than a fixed delay
+        self.recv_until(sock, b"Choice [", 3)
         sock.settimeout(5)
-        time.sleep(3)  # Wait for initial negotiation
         return sock
 
-    def send_and_read(self, sock, command, wait=2):
-        """Send command and read response"""
+    def recv_until(self, sock, needle, timeout):
+        """Read until needle (bytes, or a compiled pattern) matches the data, or timeout"""
+        if isinstance(needle, bytes):
+            found = lambda data: needle in data
+        else:
+            found = needle.search
+        data = bytearray()
+        deadline = time.monotonic() + timeout
+        while not found(data):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            sock.settimeout(remaining)
+            try:
+                chunk = sock.recv(4096)
+            except socket.timeout:
+                break
+            if not chunk:
+                break
+            data += chunk
+        return bytes(data)
+
+    def send_and_read(self, sock, command, wait=2, prompt=PROMPT_RE):
+        """Send command and read the response up to the next prompt (at most `wait` seconds)"""
         sock.send((command + '\r\n').encode())
-        time.sleep(wait)
-        try:
-            data = sock.recv(8192)
-            return data.decode('utf-8', errors='replace')
-        except socket.timeout:
-            return ""
+        data = self.recv_until(sock, prompt, wait)
+        sock.settimeout(5)
+        return data.decode('utf-8', errors='replace')
 
     def test_login_menu(self):
         """Test Login Menu (L, R, ?, Q)"""
         print("Testing Login Menu...")
-        sock = self.connect()
+        sock = self.sock
 
         # Get initial screen
         response = self.send_and_read(sock, "1", 3)  # Select English
@@ -58,8 +84,6 @@ class BBSMenuTester:
         else:
             self.results['failed'].append("Login Menu: Quit (Q)")
 
-        sock.close()
-
     def test_main_menu(self):
         """Test Main Menu Navigation"""
         print("Testing Main Menu...")
@@ -102,15 +126,21 @@ class BBSMenuTester:
         print("PERESTROIKA BBS MENU COVERAGE TEST")
         print("=" * 50)
 
-        # Test all menus
-        self.test_login_menu()
-        self.test_main_menu()
-        self.test_message_boards()
-        self.test_file_menu()
-        self.test_chat_menu()
-        self.test_mail_menu()
-        self.test_user_settings()
-        self.test_admin_menu()
+        # Negotiate once and share the session across tests
+        self.sock = self.connect()
+        try:
+            # Test all menus (Q ends the session, so login menu runs last
+            # among tests that talk to the server)
+            self.test_main_menu()
+            self.test_message_boards()
+            self.test_file_menu()
+            self.test_chat_menu()
+            self.test_mail_menu()
+            self.test_user_settings()
+            self.test_admin_menu()
+            self.test_login_menu()
+        finally:
+            self.sock.close()
 
         # Print results
         print("\n" + "=" * 50)
@@ -1,15 +1,22 @@
 #!/usr/bin/env python3
 """Test the 4 display modes of the template system"""
 
+import io
 import socket
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 def test_display_mode(mode: int, mode_name: str):
-    """Test a specific display mode"""
-    print(f"\n{'='*60}")
-    print(f"Testing Mode {mode}: {mode_name}")
-    print(f"{'='*60}")
+    """Test a specific display mode, returning (success, report text)"""
+    # Tests run concurrently, so buffer the report and print it as one block
+    out = io.StringIO()
+    log = partial(print, file=out)
+
+    log(f"\n{'='*60}")
+    log(f"Testing Mode {mode}: {mode_name}")
+    log(f"{'='*60}")
 
     try:
         # Connect to BBS
@@ -23,7 +30,7 @@ def test_display_mode(mode: int, mode_name: str):
         # Read initial data (telnet negotiation)
         try:
             initial = s.recv(4096)
-            print(f"Received {len(initial)} bytes of initial data")
+            log(f"Received {len(initial)} bytes of initial data")
         except socket.timeout:
             pass
 
@@ -43,80 +50,74 @@ def test_display_mode(mode: int, mode_name: str):
         time.sleep(2)
 
         # Read accumulated output
-        output = b""
+        output = bytearray()
         s.settimeout(0.5)
         while True:
             try:
                 data = s.recv(4096)
                 if data:
-                    output += data
+                    output.extend(data)
                 else:
                     break
             except socket.timeout:
                 break
 
-        # Decode output
-        try:
-            output_str = output.decode('utf-8', errors='replace')
-        except:
-            output_str = str(output)
+        # Decode once; ANSI detection works on the raw bytes
+        output_str = output.decode('utf-8', errors='replace')
+        has_ansi = b'\x1b[' in output
 
         # Check for expected patterns
         if mode == 1:  # 80x24 ANSI
-            has_ansi = b'\x1b[' in output
             has_box = '═' in output_str or '╔' in output_str
             if has_ansi and has_box:
-                print("✓ ANSI codes detected")
-                print("✓ Box drawing characters detected")
-                print("✓ 80-column format confirmed")
+                log("✓ ANSI codes detected")
+                log("✓ Box drawing characters detected")
+                log("✓ 80-column format confirmed")
             else:
-                print(f"✗ Missing expected features (ANSI: {has_ansi}, Box: {has_box})")
+                log(f"✗ Missing expected features (ANSI: {has_ansi}, Box: {has_box})")
 
         elif mode == 2:  # 80x24 Plain
-            has_ansi = b'\x1b[' in output
             has_ascii = '=' in output_str or '+' in output_str
             if not has_ansi and has_ascii:
-                print("✓ No ANSI codes (plain text)")
-                print("✓ ASCII characters detected")
-                print("✓ 80-column format confirmed")
+                log("✓ No ANSI codes (plain text)")
+                log("✓ ASCII characters detected")
+                log("✓ 80-column format confirmed")
             else:
-                print(f"✗ Unexpected formatting (Has ANSI: {has_ansi})")
+                log(f"✗ Unexpected formatting (Has ANSI: {has_ansi})")
 
         elif mode == 3:  # 40x24 ANSI
-            has_ansi = b'\x1b[' in output
             has_box = '╔' in output_str or '║' in output_str
             if has_ansi and has_box:
-                print("✓ ANSI codes detected")
-                print("✓ Box drawing for narrow display")
-                print("✓ 40-column format")
+                log("✓ ANSI codes detected")
+                log("✓ Box drawing for narrow display")
+                log("✓ 40-column format")
             else:
-                print(f"✗ Missing expected features (ANSI: {has_ansi}, Box: {has_box})")
+                log(f"✗ Missing expected features (ANSI: {has_ansi}, Box: {has_box})")
 
         elif mode == 4:  # 40x24 Plain
-            has_ansi = b'\x1b[' in output
             has_ascii = '+' in output_str or '-' in output_str
             if not has_ansi and has_ascii:
-                print("✓ No ANSI codes (plain text)")
-                print("✓ ASCII characters for narrow display")
-                print("✓ 40-column format")
+                log("✓ No ANSI codes (plain text)")
+                log("✓ ASCII characters for narrow display")
+                log("✓ 40-column format")
             else:
-                print(f"✗ Unexpected formatting (Has ANSI: {has_ansi})")
+                log(f"✗ Unexpected formatting (Has ANSI: {has_ansi})")
 
         # Show sample output
-        print("\nSample output (first 300 chars):")
-        print("-" * 40)
+        log("\nSample output (first 300 chars):")
+        log("-" * 40)
         sample = output_str[:300].replace('\x1b', '\\x1b')
         for line in sample.split('\r\n')[:5]:
-            print(line)
-        print("-" * 40)
+            log(line)
+        log("-" * 40)
 
         s.close()
-        print(f"✓ Test completed for {mode_name}")
-        return True
+        log(f"✓ Test completed for {mode_name}")
+        return True, out.getvalue()
 
     except Exception as e:
-        print(f"✗ Error testing {mode_name}: {e}")
-        return False
+        log(f"✗ Error testing {mode_name}: {e}")
+        return False, out.getvalue()
 
 def main():
     """Test all 4 display modes"""
@@ -131,11 +132,14 @@ def main():
         (4, "40x24 plain text")
     ]
 
+    # Each mode is its own connection, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(modes)) as pool:
+        outcomes = list(pool.map(lambda m: test_display_mode(*m), modes))
+
     results = []
-    for mode_num, mode_name in modes:
-        success = test_display_mode(mode_num, mode_name)
+    for (mode_num, mode_name), (success, report) in zip(modes, outcomes):
+        print(report, end="")
         results.append((mode_name, success))
-        time.sleep(2)  # Wait between tests
 
     # Summary
     print("\n" + "="*60)
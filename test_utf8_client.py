@@ -10,7 +10,7 @@ sock.setblocking(False)
 
 def read_available(sock, timeout=1.0):
     """Read all available data from socket"""
-    data = b""
+    data = bytearray()
     end_time = time.time() + timeout
     while time.time() < end_time:
         ready = select.select([sock], [], [], 0.1)
@@ -18,7 +18,7 @@ def read_available(sock, timeout=1.0):
             try:
                 chunk = sock.recv(4096)
                 if chunk:
-                    data += chunk
+                    data.extend(chunk)
                 else:
                     break
             except BlockingIOError:
@@ -26,7 +26,7 @@ def read_available(sock, timeout=1.0):
         else:
             if data:  # Got some data, can return
                 break
-    return data
+    return bytes(data)
 
 # Wait for initial negotiation and prompt
 time.sleep(0.5)
@@ -20,7 +20,7 @@ class TelnetClient:
 
     def send_telnet_response(self, data):
         """Respond to telnet negotiation"""
-        response = b""
+        response = bytearray()
         i = 0
         while i < len(data):
             if data[i] == self.IAC and i + 2 < len(data):
@@ -48,8 +48,8 @@ class TelnetClient:
 
     def read_with_timeout(self, timeout=2.0):
         """Read data and handle telnet negotiation"""
-        data = b""
-        text_data = b""
+        data = bytearray()
+        text_data = bytearray()
         end_time = time.time() + timeout
 
         while time.time() < end_time:
@@ -58,7 +58,7 @@ class TelnetClient:
                 try:
                     chunk = self.sock.recv(4096)
                     if chunk:
-                        data += chunk
+                        data.extend(chunk)
                         # Handle telnet commands
                         self.send_telnet_response(chunk)
 
@@ -68,14 +68,14 @@ class TelnetClient:
                             if chunk[i] == self.IAC and i + 2 < len(chunk):
                                 i += 3  # Skip telnet command
                             elif chunk[i] != self.IAC:
-                                text_data += bytes([chunk[i]])
+                                text_data.append(chunk[i])
                                 i += 1
                             else:
                                 i += 1
                 except BlockingIOError:
                     pass
 
-        return text_data
+        return bytes(text_data)
 
     def interact_with_bbs(self):
         """Interact with the BBS by selecting options"""